@@ -64,6 +64,7 @@ import ifcopenshell.guid
 from typing import List, Tuple, Dict, Optional, Any
 from dataclasses import dataclass
 import math
+import numpy as np
 
 
 @dataclass
@@ -92,6 +93,45 @@ class StationPoint:
         return f"Station({self.station:.2f}m, reason='{self.reason}')"
 
 
+def _densify_curves(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    lengths: np.ndarray,
+    curve_interval: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate densified stations for all horizontal curves at once.
+    
+    Each curve contributes its start station, interior stations every
+    curve_interval (stopping 0.01m short of the curve length) and its end
+    station, in that order, curve after curve.
+    
+    Args:
+        starts: Curve start stations (m)
+        ends: Curve end stations (m)
+        lengths: Curve lengths (m)
+        curve_interval: Spacing of interior stations (m)
+        
+    Returns:
+        Tuple of (stations, reasons) arrays
+    """
+    # Interior station count per curve, as np.arange(interval, length - 0.01, interval)
+    interior = np.maximum(np.ceil((lengths - 0.01 - curve_interval) / curve_interval), 0)
+    sizes = interior.astype(np.int64) + 2
+    
+    # Position of each output station within its curve
+    curve = np.repeat(np.arange(len(sizes)), sizes)
+    first = np.cumsum(sizes) - sizes
+    j = np.arange(sizes.sum()) - first[curve]
+    is_end = j == sizes[curve] - 1
+    
+    stations = np.where(is_end, ends[curve], starts[curve] + j * curve_interval)
+    reasons = np.where(
+        j == 0, "curve_start", np.where(is_end, "curve_end", "curve_interior")
+    )
+    return stations, reasons
+
+
 class StationManager:
     """
     Intelligent station calculation for corridor generation.
@@ -124,6 +164,9 @@ class StationManager:
         self.interval = interval
         self.stations: List[StationPoint] = []
         
+        # Candidate (stations, reason) arrays collected before merging
+        self._candidates: List[Tuple[np.ndarray, Any]] = []
+        
         # Tolerance for merging close stations
         self.merge_tolerance = 0.5  # meters
     
@@ -148,8 +191,12 @@ class StationManager:
         3. Add vertical alignment stations
         4. Add critical stations
         5. Merge and sort
+        
+        Candidate stations are collected as arrays and only the stations
+        that survive merging are evaluated on the alignment.
         """
         self.stations = []
+        self._candidates = []
         
         # Step 1: Base interval stations
         self._add_interval_stations()
@@ -169,23 +216,22 @@ class StationManager:
         
         return self.stations
     
+    def _add_candidates(self, stations: Any, reason: Any):
+        """Queue candidate stations for merging, with one reason for all or one per station."""
+        self._candidates.append((np.asarray(stations, dtype=np.float64), reason))
+    
     def _add_interval_stations(self):
         """Add uniform interval stations along the alignment."""
         start = self.alignment.get_start_station()
         end = self.alignment.get_end_station()
         
-        station = start
-        while station <= end:
-            point = self._create_station_point(station, "interval")
-            if point:
-                self.stations.append(point)
-            station += self.interval
+        count = int(np.floor((end - start) / self.interval + 1e-9)) + 1
+        stations = start + self.interval * np.arange(max(count, 1))
+        self._add_candidates(stations, "interval")
         
         # Ensure end station is included
-        if abs(self.stations[-1].station - end) > 0.01:
-            point = self._create_station_point(end, "end")
-            if point:
-                self.stations.append(point)
+        if abs(stations[-1] - end) > 0.01:
+            self._add_candidates([end], "end")
     
     def _add_horizontal_curve_stations(self, densification_factor: float):
         """
@@ -200,31 +246,20 @@ class StationManager:
         if not hasattr(h_align, 'segments'):
             return
         
-        for segment in h_align.segments:
-            # Check if segment is a curve
-            if hasattr(segment, 'type') and segment.type == 'CURVE':
-                # Add station at curve start
-                start_sta = segment.start_station
-                point = self._create_station_point(start_sta, "curve_start")
-                if point:
-                    self.stations.append(point)
-                
-                # Add stations within curve (denser than interval)
-                curve_interval = self.interval / densification_factor
-                length = segment.length
-                station = start_sta + curve_interval
-                
-                while station < start_sta + length - 0.01:
-                    point = self._create_station_point(station, "curve_interior")
-                    if point:
-                        self.stations.append(point)
-                    station += curve_interval
-                
-                # Add station at curve end
-                end_sta = segment.end_station
-                point = self._create_station_point(end_sta, "curve_end")
-                if point:
-                    self.stations.append(point)
+        curves = [
+            segment for segment in h_align.segments
+            if hasattr(segment, 'type') and segment.type == 'CURVE'
+        ]
+        if not curves:
+            return
+        
+        # Curve start, interior stations (denser than interval) and curve end
+        self._add_candidates(*_densify_curves(
+            np.array([c.start_station for c in curves], dtype=np.float64),
+            np.array([c.end_station for c in curves], dtype=np.float64),
+            np.array([c.length for c in curves], dtype=np.float64),
+            self.interval / densification_factor
+        ))
     
     def _add_vertical_alignment_stations(self):
         """Add stations at vertical alignment critical points (PVIs, curve points)."""
@@ -237,28 +272,19 @@ class StationManager:
         for pvi in v_align.pvis:
             # Add station at PVI
             station = pvi.station
-            point = self._create_station_point(station, "pvi")
-            if point:
-                self.stations.append(point)
+            self._add_candidates([station], "pvi")
             
-            # If PVI has a curve, add stations throughout the curve
+            # If PVI has a curve, add quarter points on the vertical curve
             if hasattr(pvi, 'curve_length') and pvi.curve_length > 0:
                 curve_start = station - pvi.curve_length / 2
-                curve_end = station + pvi.curve_length / 2
-                
-                # Add quarter points on vertical curves
-                for fraction in [0.25, 0.75]:
-                    curve_station = curve_start + pvi.curve_length * fraction
-                    point = self._create_station_point(curve_station, "vertical_curve")
-                    if point:
-                        self.stations.append(point)
+                self._add_candidates(
+                    curve_start + pvi.curve_length * np.array([0.25, 0.75]),
+                    "vertical_curve"
+                )
     
     def _add_critical_stations(self, critical_stations: List[float]):
         """Add user-specified critical stations."""
-        for station in critical_stations:
-            point = self._create_station_point(station, "critical")
-            if point:
-                self.stations.append(point)
+        self._add_candidates(critical_stations, "critical")
     
     def _create_station_point(self, station: float, reason: str) -> Optional[StationPoint]:
         """
@@ -295,42 +321,71 @@ class StationManager:
             return None
     
     def _merge_and_sort(self):
-        """Merge stations that are too close together and sort by station."""
-        if not self.stations:
+        """
+        Merge stations that are too close together and sort by station.
+        
+        Works on the candidate arrays: out-of-range candidates are dropped,
+        the rest are sorted (stable, so ties keep insertion order) and
+        merged, and StationPoints are created only for the survivors.
+        """
+        if not self._candidates:
             return
         
+        # Priority of each reason when merging close stations
+        priority = {
+            "start": 5,
+            "end": 5,
+            "pvi": 4,
+            "curve_start": 4,
+            "curve_end": 4,
+            "critical": 3,
+            "vertical_curve": 2,
+            "curve_interior": 1,
+            "interval": 0
+        }
+        
+        stations = np.concatenate([values for values, _ in self._candidates])
+        reasons = np.concatenate([
+            np.broadcast_to(np.asarray(reason, dtype=str), values.shape)
+            for values, reason in self._candidates
+        ])
+        
+        # Drop candidates outside the alignment range
+        start = self.alignment.get_start_station()
+        end = self.alignment.get_end_station()
+        in_range = (stations >= start) & (stations <= end)
+        stations = stations[in_range]
+        reasons = reasons[in_range]
+        
+        # Priority per station, looked up once per distinct reason
+        names, inverse = np.unique(reasons, return_inverse=True)
+        ranks = np.array([priority.get(name, 0) for name in names], dtype=np.int64)[inverse]
+        
         # Sort by station
-        self.stations.sort(key=lambda s: s.station)
+        order = np.argsort(stations, kind='stable')
+        values = stations[order].tolist()
+        reasons = reasons[order].tolist()
+        ranks = ranks[order].tolist()
         
-        # Merge close stations
-        merged = [self.stations[0]]
+        # Merge close stations; each station is compared with the last kept
+        # one, which may itself have replaced an earlier station
+        merged = [0] if values else []
         
-        for station in self.stations[1:]:
+        for i in range(1, len(values)):
             last = merged[-1]
             
             # If this station is very close to the last one, skip it
-            if abs(station.station - last.station) < self.merge_tolerance:
+            if abs(values[i] - values[last]) < self.merge_tolerance:
                 # Keep the one with more important reason
-                priority = {
-                    "start": 5,
-                    "end": 5,
-                    "pvi": 4,
-                    "curve_start": 4,
-                    "curve_end": 4,
-                    "critical": 3,
-                    "vertical_curve": 2,
-                    "curve_interior": 1,
-                    "interval": 0
-                }
-                
-                if priority.get(station.reason, 0) > priority.get(last.reason, 0):
+                if ranks[i] > ranks[last]:
                     # Replace last with this one
-                    merged[-1] = station
+                    merged[-1] = i
             else:
                 # Add this station
-                merged.append(station)
+                merged.append(i)
         
-        self.stations = merged
+        points = (self._create_station_point(values[i], reasons[i]) for i in merged)
+        self.stations = [point for point in points if point]
     
     def get_station_count(self) -> int:
         """Get the number of stations."""
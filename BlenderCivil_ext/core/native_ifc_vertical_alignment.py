@@ -42,6 +42,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 import math
+import numpy as np
 import ifcopenshell
 import ifcopenshell.api
 
@@ -971,6 +972,13 @@ class VerticalAlignment:
         self.pvis: List[PVI] = []
         self.segments: List[VerticalSegment] = []
         
+        # Per-segment arrays for vectorized queries, rebuilt with segments
+        self._seg_start = np.empty(0)
+        self._seg_end = np.empty(0)
+        self._seg_a0 = np.empty(0)
+        self._seg_a1 = np.empty(0)
+        self._seg_a2 = np.empty(0)
+        
         # Design standards based on speed
         if design_speed in DESIGN_STANDARDS:
             standards = DESIGN_STANDARDS[design_speed]
@@ -1326,6 +1334,7 @@ class VerticalAlignment:
         self.segments.clear()
         
         if len(self.pvis) < 2:
+            self._update_segment_arrays()
             return  # Need at least 2 PVIs
         
         current_station = self.pvis[0].station
@@ -1384,6 +1393,27 @@ class VerticalAlignment:
 
                 current_station = pvi2.station
                 current_elevation = tangent.end_elevation
+        
+        self._update_segment_arrays()
+    
+    def _update_segment_arrays(self) -> None:
+        """Copy segment parameters into contiguous arrays
+        
+        Stores start/end station and the polynomial coefficients of each
+        segment, E(x) = a0 + a1*x + a2*x^2 with x measured from the segment
+        start, so queries can locate and evaluate segments without touching
+        the segment objects. Tangents are stored with a2 = 0.
+        """
+        params = np.array([
+            (seg.start_station, seg.end_station, seg.start_elevation, seg.g1,
+             0.5 * (seg.g2 - seg.g1) / seg.length)
+            if isinstance(seg, ParabolicSegment) else
+            (seg.start_station, seg.end_station, seg.start_elevation, seg.grade, 0.0)
+            for seg in self.segments
+        ], dtype=np.float64).reshape(-1, 5)
+        
+        (self._seg_start, self._seg_end, self._seg_a0,
+         self._seg_a1, self._seg_a2) = params.T.copy()
     
     # ========================================================================
     # ELEVATION & GRADE QUERIES
@@ -1401,19 +1431,7 @@ class VerticalAlignment:
         Raises:
             ValueError: If station is outside alignment range
         """
-        if len(self.segments) == 0:
-            raise ValueError("No segments generated (need at least 2 PVIs)")
-        
-        # Find segment containing this station
-        for segment in self.segments:
-            if segment.contains_station(station):
-                return segment.get_elevation(station)
-        
-        # Station not found in any segment
-        raise ValueError(
-            f"Station {station:.3f}m outside alignment range "
-            f"[{self.start_station:.3f}, {self.end_station:.3f}]"
-        )
+        return self.query(station)[0]
     
     def get_grade(self, station: float) -> float:
         """Get grade at any station along alignment
@@ -1424,22 +1442,104 @@ class VerticalAlignment:
         Returns:
             Grade as decimal (e.g., 0.02 = 2%)
         
+        Raises:
+            ValueError: If station is outside alignment range
+        """
+        return self.query(station)[1]
+    
+    def query(self, station: float) -> Tuple[float, float]:
+        """Get elevation and grade at a station with one segment lookup
+        
+        Args:
+            station: Station location (m)
+        
+        Returns:
+            Tuple of (elevation, grade)
+        
         Raises:
             ValueError: If station is outside alignment range
         """
         if len(self.segments) == 0:
             raise ValueError("No segments generated (need at least 2 PVIs)")
         
-        # Find segment containing this station
-        for segment in self.segments:
-            if segment.contains_station(station):
-                return segment.get_grade(station)
+        # First segment reaching the station, as in query_batch
+        i = int(np.searchsorted(self._seg_end, station - 1e-6, side='left'))
+        if i == len(self._seg_end) or station < self._seg_start[i] - 1e-6:
+            raise ValueError(
+                f"Station {station:.3f}m outside alignment range "
+                f"[{self.start_station:.3f}, {self.end_station:.3f}]"
+            )
         
-        # Station not found in any segment
-        raise ValueError(
-            f"Station {station:.3f}m outside alignment range "
-            f"[{self.start_station:.3f}, {self.end_station:.3f}]"
-        )
+        x = station - float(self._seg_start[i])
+        a1 = float(self._seg_a1[i])
+        a2 = float(self._seg_a2[i])
+        elevation = float(self._seg_a0[i]) + x * (a1 + x * a2)
+        return elevation, a1 + 2.0 * a2 * x
+    
+    def query_batch(self, stations) -> Tuple[np.ndarray, np.ndarray]:
+        """Get elevations and grades at an array of stations
+        
+        Vectorized counterpart of query(). Each station is assigned to its
+        segment with a single searchsorted call, then the tangent and
+        parabola equations are evaluated for all stations at once.
+        
+        Args:
+            stations: Sequence or array of station locations (m)
+        
+        Returns:
+            Tuple of (elevations, grades) float64 arrays
+        
+        Raises:
+            ValueError: If no segments exist or a station is outside alignment range
+        """
+        if len(self.segments) == 0:
+            raise ValueError("No segments generated (need at least 2 PVIs)")
+        
+        stations = np.asarray(stations, dtype=np.float64)
+        seg_start = self._seg_start
+        seg_end = self._seg_end
+        
+        # First segment whose end (within tolerance) reaches the station, so
+        # stations on a shared boundary resolve to the earlier segment
+        tolerance = 1e-6
+        idx = np.searchsorted(seg_end, stations - tolerance, side='left')
+        outside = (idx == len(seg_end))
+        idx[outside] = len(seg_end) - 1
+        outside |= stations < seg_start[idx] - tolerance
+        if outside.any():
+            station = stations[outside][0]
+            raise ValueError(
+                f"Station {station:.3f}m outside alignment range "
+                f"[{self.start_station:.3f}, {self.end_station:.3f}]"
+            )
+        
+        # E(x) = a0 + x*(a1 + x*a2), g(x) = a1 + 2*a2*x
+        x = stations - seg_start[idx]
+        a1 = self._seg_a1[idx]
+        a2 = self._seg_a2[idx]
+        elevations = self._seg_a0[idx] + x * (a1 + x * a2)
+        grades = a1 + 2.0 * a2 * x
+        
+        return elevations, grades
+    
+    def get_profile_points_vec(
+        self,
+        stations
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get elevations and grades at an array of stations
+        
+        Args:
+            stations: Sequence or array of station locations (m)
+        
+        Returns:
+            Tuple of (stations, elevations, grades) float64 arrays
+        
+        Raises:
+            ValueError: If no segments exist or a station is outside alignment range
+        """
+        stations = np.asarray(stations, dtype=np.float64)
+        elevations, grades = self.query_batch(stations)
+        return stations, elevations, grades
     
     def get_profile_points(
         self,
@@ -1460,46 +1560,22 @@ class VerticalAlignment:
         if len(self.segments) == 0:
             return []
         
-        points = []
-        
         # Sample at regular intervals
-        station = self.start_station
-        while station <= self.end_station:
-            try:
-                elev = self.get_elevation(station)
-                grade = self.get_grade(station)
-                points.append((station, elev, grade))
-            except ValueError:
-                pass  # Skip invalid stations
-            
-            station += interval
+        count = int(math.floor(self.length / interval + 1e-9)) + 1
+        stations = self.start_station + interval * np.arange(count)
         
         # Add exact PVI locations if requested
         if include_pvis:
-            pvi_points = []
-            for pvi in self.pvis:
-                try:
-                    elev = self.get_elevation(pvi.station)
-                    grade = self.get_grade(pvi.station)
-                    pvi_points.append((pvi.station, elev, grade))
-                except ValueError:
-                    pass
-            
-            # Merge and sort
-            all_points = points + pvi_points
-            all_points.sort(key=lambda p: p[0])
-            
-            # Remove duplicates (keep PVI points)
-            unique_points = []
-            last_sta = -float('inf')
-            for sta, elev, grade in all_points:
-                if abs(sta - last_sta) > 1e-6:
-                    unique_points.append((sta, elev, grade))
-                    last_sta = sta
+            stations = np.sort(np.concatenate(
+                (stations, [pvi.station for pvi in self.pvis])
+            ))
             
-            return unique_points
+            # Remove duplicates
+            keep = np.concatenate(([True], np.diff(stations) > 1e-6))
+            stations = stations[keep]
         
-        return points
+        stations, elevations, grades = self.get_profile_points_vec(stations)
+        return list(zip(stations.tolist(), elevations.tolist(), grades.tolist()))
     
     # ========================================================================
     # PROPERTIES
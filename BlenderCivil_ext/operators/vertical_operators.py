@@ -23,11 +23,332 @@ Vertical Alignment Operators
 Handles all vertical alignment operations in Blender
 """
 
+from contextlib import contextmanager
+
 import bpy
+import numpy as np
 from bpy.types import Operator
 from bpy.props import FloatProperty, StringProperty, IntProperty
 
 
+def _read_float_fields(collection, *names):
+    """Read float fields of every collection item into arrays, one foreach_get per field
+    
+    FloatProperty stores float32, so the buffers are float32 to keep
+    foreach_get on its direct copy path; the arrays are returned as float64.
+    """
+    arrays = []
+    for name in names:
+        values = np.empty(len(collection), dtype=np.float32)
+        collection.foreach_get(name, values)
+        arrays.append(values.astype(np.float64))
+    return arrays
+
+
+def _write_float_fields(collection, **fields):
+    """Write arrays to float fields of every collection item, one foreach_set per field"""
+    for name, values in fields.items():
+        collection.foreach_set(name, np.asarray(values, dtype=np.float32))
+
+
+def _query_segments(segments, stations):
+    """Look up elevation and grade at stations along the generated segments
+    
+    Args:
+        segments: Vertical segment collection (bc_vertical.segments)
+        stations: Array of stations (m)
+    
+    Returns:
+        Tuple of (elevations, grades, found) arrays; elevation and grade
+        are 0.0 where found is False
+    """
+    if len(segments) == 0:
+        return np.zeros(len(stations)), np.zeros(len(stations)), np.zeros(len(stations), bool)
+    
+    seg_start, seg_end, seg_length, start_elev, end_elev, seg_grade = _read_float_fields(
+        segments, "start_station", "end_station", "length",
+        "start_elevation", "end_elevation", "grade")
+    
+    # First segment whose end reaches each station
+    idx = np.searchsorted(seg_end, stations, side='left')
+    found = idx < len(seg_end)
+    idx[~found] = len(seg_end) - 1
+    found &= stations >= seg_start[idx]
+    
+    # Linear interpolation between segment end elevations
+    length = seg_length[idx]
+    t = np.divide(stations - seg_start[idx], length,
+                  out=np.zeros(len(stations)), where=length > 0)
+    elevations = np.where(found, start_elev[idx] + t * (end_elev[idx] - start_elev[idx]), 0.0)
+    grades = np.where(found, seg_grade[idx], 0.0)
+    return elevations, grades, found
+
+
+def _calculate_grades(vertical):
+    """Calculate grades, grade changes and K-values and store them on the PVIs
+    
+    Also updates the alignment statistics (length and elevation range).
+    
+    Args:
+        vertical: Vertical alignment properties (scene.bc_vertical)
+    
+    Returns:
+        Tuple of (stations, elevations, curve_lengths, grade_in, grade_out,
+        k_values, curve_types) for reuse by the later rebuild steps
+    
+    Raises:
+        ValueError: If two PVIs share a station
+    """
+    pvis = vertical.pvis
+    count = len(pvis)
+    
+    (stations, elevations, curve_lengths,
+     grade_in, grade_out, grade_change, k_values) = _read_float_fields(
+        pvis, "station", "elevation", "curve_length",
+        "grade_in", "grade_out", "grade_change", "k_value")
+    
+    runs = np.diff(stations)
+    if not runs.all():
+        i = int(np.flatnonzero(runs == 0)[0])
+        raise ValueError(f"PVIs at same station: {stations[i]:.3f}m")
+    
+    # Grades between consecutive PVIs (decimal)
+    grades = np.diff(elevations) / runs
+    grade_out[:-1] = grades
+    grade_in[1:] = grades
+    
+    # Grade changes and K-values at interior PVIs
+    inner = slice(1, count - 1)
+    grade_change[inner] = np.abs(grade_out[inner] - grade_in[inner])
+    grade_change_percent = grade_change[inner] * 100
+    has_curve = (curve_lengths[inner] > 0) & (grade_change_percent > 0.01)
+    k_values[inner] = np.divide(curve_lengths[inner], grade_change_percent,
+                                out=np.zeros(count - 2), where=has_curve)
+    
+    _write_float_fields(pvis, grade_in=grade_in, grade_out=grade_out,
+                        grade_change=grade_change, k_value=k_values)
+    
+    # Curve type is a string property, which foreach_set cannot write
+    curve_types = [pvi.curve_type_display for pvi in pvis]
+    for i, curved in enumerate(has_curve, start=1):
+        if curved:
+            curve_types[i] = "Crest" if grade_in[i] > grade_out[i] else "Sag"
+        else:
+            curve_types[i] = "None"
+        pvis[i].curve_type_display = curve_types[i]
+    
+    # Update statistics
+    vertical.total_length = float(stations[-1] - stations[0])
+    vertical.elevation_min = float(elevations.min())
+    vertical.elevation_max = float(elevations.max())
+    
+    return stations, elevations, curve_lengths, grade_in, grade_out, k_values, curve_types
+
+
+def _generate_segments(vertical, stations, elevations, curve_lengths, grade_in, grade_out):
+    """Rebuild the tangent and curve segment collection from PVI arrays
+    
+    Args:
+        vertical: Vertical alignment properties (scene.bc_vertical)
+        stations, elevations, curve_lengths, grade_in, grade_out: PVI field arrays
+    """
+    # Clear existing segments
+    vertical.segments.clear()
+    
+    current_station = float(stations[0])
+    current_elevation = float(elevations[0])
+    
+    for i in range(len(stations) - 1):
+        grade = float(grade_out[i])
+        
+        # Check if PVI has a curve
+        if curve_lengths[i] > 0 and i > 0:
+            # Tangent before curve
+            curve_length = float(curve_lengths[i])
+            bvc_station = float(stations[i]) - curve_length / 2
+            
+            if bvc_station > current_station:
+                # Add tangent segment
+                seg = vertical.segments.add()
+                seg.segment_type = "TANGENT"
+                seg.start_station = current_station
+                seg.end_station = bvc_station
+                seg.length = bvc_station - current_station
+                seg.start_elevation = current_elevation
+                seg.end_elevation = current_elevation + (bvc_station - current_station) * grade
+                seg.grade = grade
+                
+                current_station = bvc_station
+                current_elevation = seg.end_elevation
+            
+            # Add curve segment
+            evc_station = float(stations[i]) + curve_length / 2
+            seg = vertical.segments.add()
+            seg.segment_type = "CURVE"
+            seg.start_station = current_station
+            seg.end_station = evc_station
+            seg.length = curve_length
+            seg.start_elevation = current_elevation
+            # Approximate end elevation (simplified)
+            seg.end_elevation = current_elevation + curve_length * (grade + grade_in[i + 1]) / 2
+            seg.grade = (grade + grade_in[i + 1]) / 2  # Average grade
+            
+            current_station = evc_station
+            current_elevation = seg.end_elevation
+    
+    # Final tangent to last PVI
+    if current_station < stations[-1]:
+        seg = vertical.segments.add()
+        seg.segment_type = "TANGENT"
+        seg.start_station = current_station
+        seg.end_station = stations[-1]
+        seg.length = stations[-1] - current_station
+        seg.start_elevation = current_elevation
+        seg.end_elevation = elevations[-1]
+        seg.grade = (elevations[-1] - current_elevation) / (stations[-1] - current_station)
+
+
+def _validate_vertical(vertical, stations, curve_lengths, k_values, curve_types):
+    """Check PVIs against design standards and store the validation status
+    
+    Args:
+        vertical: Vertical alignment properties (scene.bc_vertical)
+        stations, curve_lengths, k_values: PVI field arrays
+        curve_types: PVI curve type strings ("Crest", "Sag" or "None")
+    
+    Returns:
+        Tuple of (report_type, message) for Operator.report
+    """
+    errors = []
+    warnings = []
+    
+    # Check station ordering
+    for i in np.flatnonzero(np.diff(stations) <= 0):
+        errors.append(f"PVI {i+1} station not increasing")
+    
+    # Check K-values against minimums
+    for i in np.flatnonzero(curve_lengths > 0):
+        k_value = k_values[i]
+        if k_value < 0.01:
+            warnings.append(f"PVI {i+1}: K-value not calculated")
+        elif curve_types[i] == "Crest":
+            if k_value < vertical.min_k_crest:
+                warnings.append(
+                    f"PVI {i+1}: Crest K={k_value:.1f} < min {vertical.min_k_crest:.1f}"
+                )
+        elif curve_types[i] == "Sag":
+            if k_value < vertical.min_k_sag:
+                warnings.append(
+                    f"PVI {i+1}: Sag K={k_value:.1f} < min {vertical.min_k_sag:.1f}"
+                )
+    
+    # Update validation status
+    if len(errors) > 0:
+        vertical.is_valid = False
+        vertical.validation_message = "ERRORS: " + "; ".join(errors)
+        return 'ERROR', vertical.validation_message
+    elif len(warnings) > 0:
+        vertical.is_valid = True
+        vertical.validation_message = "WARNINGS: " + "; ".join(warnings)
+        return 'WARNING', vertical.validation_message
+    else:
+        vertical.is_valid = True
+        vertical.validation_message = "All checks passed"
+        return 'INFO', "Validation passed"
+
+
+def rebuild_vertical(vertical):
+    """Recalculate grades, segments and validation in one pass over the PVIs
+    
+    PVI fields are read once and shared by all three steps, instead of
+    each step rescanning the collection. If grades cannot be calculated
+    (duplicate stations), segments are left as they are and validation
+    records the error.
+    
+    Args:
+        vertical: Vertical alignment properties (scene.bc_vertical)
+    
+    Returns:
+        Tuple of (report_type, message) for Operator.report
+    """
+    if len(vertical.pvis) < 2:
+        vertical.is_valid = False
+        vertical.validation_message = "Need at least 2 PVIs"
+        return 'WARNING', "Need at least 2 PVIs to rebuild vertical alignment"
+    
+    try:
+        (stations, elevations, curve_lengths,
+         grade_in, grade_out, k_values, curve_types) = _calculate_grades(vertical)
+    except ValueError as e:
+        stations, curve_lengths, k_values = _read_float_fields(
+            vertical.pvis, "station", "curve_length", "k_value")
+        curve_types = [pvi.curve_type_display for pvi in vertical.pvis]
+        _validate_vertical(vertical, stations, curve_lengths, k_values, curve_types)
+        return 'ERROR', str(e)
+    
+    _generate_segments(vertical, stations, elevations, curve_lengths, grade_in, grade_out)
+    return _validate_vertical(vertical, stations, curve_lengths, k_values, curve_types)
+
+
+_pending_rebuilds = set()
+
+# Nesting depth of operator writes to PVIs; the operators rebuild themselves,
+# so PVI update callbacks do not schedule another rebuild meanwhile
+_suppress_depth = 0
+
+
+@contextmanager
+def _rebuild_suppressed():
+    """Ignore PVI update callbacks for writes made inside the block"""
+    global _suppress_depth
+    _suppress_depth += 1
+    try:
+        yield
+    finally:
+        _suppress_depth -= 1
+
+
+def _run_pending_rebuilds():
+    """Timer callback: rebuild every scene whose PVIs changed since the last run"""
+    rebuilt = False
+    while _pending_rebuilds:
+        scene = bpy.data.scenes.get(_pending_rebuilds.pop())
+        if scene is not None:
+            rebuild_vertical(scene.bc_vertical)
+            rebuilt = True
+    
+    # The rebuild runs outside any operator, so record it as its own undo step
+    if rebuilt:
+        try:
+            bpy.ops.ed.undo_push(message="Rebuild Vertical Alignment")
+        except RuntimeError:
+            pass  # No window context to push undo from
+    return None
+
+
+def schedule_rebuild(scene, delay=0.05):
+    """Rebuild the scene's vertical alignment once edits have settled
+    
+    Each call restarts the timer, so dragging a PVI value in the UI
+    rebuilds once after the drag instead of on every intermediate value.
+    Grades, segments and validation are derived fields rebuilt lazily: the
+    edit and the rebuild are separate undo steps, so undoing the rebuild
+    step shows the edited PVI with the previous derived fields. Calls made
+    while operators write PVIs themselves are ignored.
+    
+    Args:
+        scene: Scene whose bc_vertical changed
+        delay: Seconds to wait for further edits
+    """
+    if _suppress_depth:
+        return
+    
+    _pending_rebuilds.add(scene.name)
+    if bpy.app.timers.is_registered(_run_pending_rebuilds):
+        bpy.app.timers.unregister(_run_pending_rebuilds)
+    bpy.app.timers.register(_run_pending_rebuilds, first_interval=delay)
+
+
 class BC_OT_AddPVI(Operator):
     """Add a new PVI to the vertical alignment"""
     bl_idname = "bc.add_pvi"
@@ -68,28 +389,28 @@ class BC_OT_AddPVI(Operator):
                 self.report({'ERROR'}, f"PVI already exists at station {self.station:.3f}m")
                 return {'CANCELLED'}
         
-        # Add new PVI
-        pvi = vertical.pvis.add()
-        pvi.station = self.station
-        pvi.elevation = self.elevation
-        pvi.curve_length = self.curve_length
-        pvi.design_speed = vertical.design_speed
-        
-        # Sort PVIs by station
-        pvis_list = list(vertical.pvis)
-        pvis_list.sort(key=lambda p: p.station)
-        vertical.pvis.clear()
-        for sorted_pvi in pvis_list:
-            new_pvi = vertical.pvis.add()
-            new_pvi.station = sorted_pvi.station
-            new_pvi.elevation = sorted_pvi.elevation
-            new_pvi.curve_length = sorted_pvi.curve_length
-            new_pvi.design_speed = sorted_pvi.design_speed
+        # No scheduled rebuild for these writes; rebuilt explicitly below
+        with _rebuild_suppressed():
+            # Add new PVI
+            pvi = vertical.pvis.add()
+            pvi.station = self.station
+            pvi.elevation = self.elevation
+            pvi.curve_length = self.curve_length
+            pvi.design_speed = vertical.design_speed
+            
+            # Sort PVIs by station
+            pvis_list = list(vertical.pvis)
+            pvis_list.sort(key=lambda p: p.station)
+            vertical.pvis.clear()
+            for sorted_pvi in pvis_list:
+                new_pvi = vertical.pvis.add()
+                new_pvi.station = sorted_pvi.station
+                new_pvi.elevation = sorted_pvi.elevation
+                new_pvi.curve_length = sorted_pvi.curve_length
+                new_pvi.design_speed = sorted_pvi.design_speed
         
         # Trigger recalculation
-        bpy.ops.bc.calculate_grades()
-        bpy.ops.bc.generate_segments()
-        bpy.ops.bc.validate_vertical()
+        rebuild_vertical(vertical)
         
         self.report({'INFO'}, f"Added PVI at station {self.station:.3f}m")
         return {'FINISHED'}
@@ -122,9 +443,7 @@ class BC_OT_RemovePVI(Operator):
                 vertical.active_pvi_index = max(0, len(vertical.pvis) - 1)
             
             # Trigger recalculation
-            bpy.ops.bc.calculate_grades()
-            bpy.ops.bc.generate_segments()
-            bpy.ops.bc.validate_vertical()
+            rebuild_vertical(vertical)
             
             self.report({'INFO'}, f"Removed PVI at station {station:.3f}m")
             return {'FINISHED'}
@@ -172,27 +491,27 @@ class BC_OT_EditPVI(Operator):
             pvi = vertical.pvis[vertical.active_pvi_index]
             old_station = pvi.station
             
-            # Update PVI
-            pvi.station = self.station
-            pvi.elevation = self.elevation
-            pvi.curve_length = self.curve_length
-            
-            # Re-sort if station changed
-            if abs(old_station - self.station) > 0.001:
-                pvis_list = list(vertical.pvis)
-                pvis_list.sort(key=lambda p: p.station)
-                vertical.pvis.clear()
-                for sorted_pvi in pvis_list:
-                    new_pvi = vertical.pvis.add()
-                    new_pvi.station = sorted_pvi.station
-                    new_pvi.elevation = sorted_pvi.elevation
-                    new_pvi.curve_length = sorted_pvi.curve_length
-                    new_pvi.design_speed = sorted_pvi.design_speed
+            # No scheduled rebuild for these writes; rebuilt explicitly below
+            with _rebuild_suppressed():
+                # Update PVI
+                pvi.station = self.station
+                pvi.elevation = self.elevation
+                pvi.curve_length = self.curve_length
+                
+                # Re-sort if station changed
+                if abs(old_station - self.station) > 0.001:
+                    pvis_list = list(vertical.pvis)
+                    pvis_list.sort(key=lambda p: p.station)
+                    vertical.pvis.clear()
+                    for sorted_pvi in pvis_list:
+                        new_pvi = vertical.pvis.add()
+                        new_pvi.station = sorted_pvi.station
+                        new_pvi.elevation = sorted_pvi.elevation
+                        new_pvi.curve_length = sorted_pvi.curve_length
+                        new_pvi.design_speed = sorted_pvi.design_speed
             
             # Trigger recalculation
-            bpy.ops.bc.calculate_grades()
-            bpy.ops.bc.generate_segments()
-            bpy.ops.bc.validate_vertical()
+            rebuild_vertical(vertical)
             
             self.report({'INFO'}, f"Updated PVI at station {self.station:.3f}m")
             return {'FINISHED'}
@@ -252,7 +571,8 @@ class BC_OT_DesignVerticalCurve(Operator):
             
             # Calculate curve length: L = K × A
             curve_length = self.k_value * grade_change
-            pvi.curve_length = curve_length
+            with _rebuild_suppressed():
+                pvi.curve_length = curve_length
             pvi.k_value = self.k_value
             
             # Determine curve type
@@ -271,8 +591,7 @@ class BC_OT_DesignVerticalCurve(Operator):
                     f"{curve_type} curve K={self.k_value:.1f} < minimum {min_k:.1f}")
             
             # Trigger recalculation
-            bpy.ops.bc.generate_segments()
-            bpy.ops.bc.validate_vertical()
+            rebuild_vertical(vertical)
             
             self.report({'INFO'}, 
                 f"Designed {curve_type} curve: L={curve_length:.2f}m, K={self.k_value:.1f}")
@@ -312,61 +631,18 @@ class BC_OT_CalculateGrades(Operator):
     
     def execute(self, context):
         vertical = context.scene.bc_vertical
-        pvis = list(vertical.pvis)
         
-        if len(pvis) < 2:
+        if len(vertical.pvis) < 2:
             self.report({'WARNING'}, "Need at least 2 PVIs to calculate grades")
             return {'CANCELLED'}
         
-        # Calculate grades between consecutive PVIs
-        for i in range(len(pvis) - 1):
-            pvi1 = pvis[i]
-            pvi2 = pvis[i + 1]
-            
-            # Calculate grade
-            rise = pvi2.elevation - pvi1.elevation
-            run = pvi2.station - pvi1.station
-            
-            if run == 0:
-                self.report({'ERROR'}, f"PVIs at same station: {pvi1.station:.3f}m")
-                return {'CANCELLED'}
-            
-            grade = rise / run  # Decimal grade
-            
-            # Set grades
-            pvi1.grade_out = grade
-            pvi2.grade_in = grade
-        
-        # Calculate grade changes and K-values
-        for i in range(1, len(pvis) - 1):
-            pvi = pvis[i]
-            pvi.grade_change = abs(pvi.grade_out - pvi.grade_in)
-            
-            # Calculate K-value if curve exists
-            if pvi.curve_length > 0:
-                grade_change_percent = pvi.grade_change * 100
-                if grade_change_percent > 0.01:
-                    pvi.k_value = pvi.curve_length / grade_change_percent
-                    
-                    # Determine curve type
-                    if pvi.grade_in > pvi.grade_out:
-                        pvi.curve_type_display = "Crest"
-                    else:
-                        pvi.curve_type_display = "Sag"
-                else:
-                    pvi.k_value = 0.0
-                    pvi.curve_type_display = "None"
-            else:
-                pvi.k_value = 0.0
-                pvi.curve_type_display = "None"
-        
-        # Update statistics
-        if len(pvis) > 0:
-            vertical.total_length = pvis[-1].station - pvis[0].station
-            vertical.elevation_min = min(p.elevation for p in pvis)
-            vertical.elevation_max = max(p.elevation for p in pvis)
+        try:
+            _calculate_grades(vertical)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
         
-        self.report({'INFO'}, f"Calculated grades for {len(pvis)} PVIs")
+        self.report({'INFO'}, f"Calculated grades for {len(vertical.pvis)} PVIs")
         return {'FINISHED'}
 
 
@@ -384,68 +660,13 @@ class BC_OT_GenerateSegments(Operator):
     
     def execute(self, context):
         vertical = context.scene.bc_vertical
-        pvis = list(vertical.pvis)
         
-        if len(pvis) < 2:
+        if len(vertical.pvis) < 2:
             self.report({'WARNING'}, "Need at least 2 PVIs to generate segments")
             return {'CANCELLED'}
         
-        # Clear existing segments
-        vertical.segments.clear()
-        
-        current_station = pvis[0].station
-        current_elevation = pvis[0].elevation
-        
-        for i in range(len(pvis) - 1):
-            pvi = pvis[i]
-            next_pvi = pvis[i + 1]
-            grade = pvi.grade_out
-            
-            # Check if PVI has a curve
-            if pvi.curve_length > 0 and i > 0:
-                # Tangent before curve
-                curve_length = pvi.curve_length
-                bvc_station = pvi.station - curve_length / 2
-                
-                if bvc_station > current_station:
-                    # Add tangent segment
-                    seg = vertical.segments.add()
-                    seg.segment_type = "TANGENT"
-                    seg.start_station = current_station
-                    seg.end_station = bvc_station
-                    seg.length = bvc_station - current_station
-                    seg.start_elevation = current_elevation
-                    seg.end_elevation = current_elevation + (bvc_station - current_station) * grade
-                    seg.grade = grade
-                    
-                    current_station = bvc_station
-                    current_elevation = seg.end_elevation
-                
-                # Add curve segment
-                evc_station = pvi.station + curve_length / 2
-                seg = vertical.segments.add()
-                seg.segment_type = "CURVE"
-                seg.start_station = current_station
-                seg.end_station = evc_station
-                seg.length = curve_length
-                seg.start_elevation = current_elevation
-                # Approximate end elevation (simplified)
-                seg.end_elevation = current_elevation + curve_length * (grade + next_pvi.grade_in) / 2
-                seg.grade = (grade + next_pvi.grade_in) / 2  # Average grade
-                
-                current_station = evc_station
-                current_elevation = seg.end_elevation
-        
-        # Final tangent to last PVI
-        if current_station < pvis[-1].station:
-            seg = vertical.segments.add()
-            seg.segment_type = "TANGENT"
-            seg.start_station = current_station
-            seg.end_station = pvis[-1].station
-            seg.length = pvis[-1].station - current_station
-            seg.start_elevation = current_elevation
-            seg.end_elevation = pvis[-1].elevation
-            seg.grade = (pvis[-1].elevation - current_elevation) / (pvis[-1].station - current_station)
+        _generate_segments(vertical, *_read_float_fields(
+            vertical.pvis, "station", "elevation", "curve_length", "grade_in", "grade_out"))
         
         self.report({'INFO'}, f"Generated {len(vertical.segments)} segments")
         return {'FINISHED'}
@@ -465,53 +686,38 @@ class BC_OT_ValidateVertical(Operator):
     
     def execute(self, context):
         vertical = context.scene.bc_vertical
-        pvis = list(vertical.pvis)
-        
-        errors = []
-        warnings = []
         
         # Check minimum PVIs
-        if len(pvis) < 2:
-            errors.append("Need at least 2 PVIs")
+        if len(vertical.pvis) < 2:
             vertical.is_valid = False
-            vertical.validation_message = "; ".join(errors)
+            vertical.validation_message = "Need at least 2 PVIs"
             return {'FINISHED'}
         
-        # Check station ordering
-        for i in range(len(pvis) - 1):
-            if pvis[i].station >= pvis[i + 1].station:
-                errors.append(f"PVI {i+1} station not increasing")
-        
-        # Check K-values against minimums
-        for i, pvi in enumerate(pvis):
-            if pvi.curve_length > 0:
-                if pvi.k_value < 0.01:
-                    warnings.append(f"PVI {i+1}: K-value not calculated")
-                elif pvi.curve_type_display == "Crest":
-                    if pvi.k_value < vertical.min_k_crest:
-                        warnings.append(
-                            f"PVI {i+1}: Crest K={pvi.k_value:.1f} < min {vertical.min_k_crest:.1f}"
-                        )
-                elif pvi.curve_type_display == "Sag":
-                    if pvi.k_value < vertical.min_k_sag:
-                        warnings.append(
-                            f"PVI {i+1}: Sag K={pvi.k_value:.1f} < min {vertical.min_k_sag:.1f}"
-                        )
-        
-        # Update validation status
-        if len(errors) > 0:
-            vertical.is_valid = False
-            vertical.validation_message = "ERRORS: " + "; ".join(errors)
-            self.report({'ERROR'}, vertical.validation_message)
-        elif len(warnings) > 0:
-            vertical.is_valid = True
-            vertical.validation_message = "WARNINGS: " + "; ".join(warnings)
-            self.report({'WARNING'}, vertical.validation_message)
-        else:
-            vertical.is_valid = True
-            vertical.validation_message = "All checks passed"
-            self.report({'INFO'}, "Validation passed")
+        stations, curve_lengths, k_values = _read_float_fields(
+            vertical.pvis, "station", "curve_length", "k_value")
+        curve_types = [pvi.curve_type_display for pvi in vertical.pvis]
         
+        report_type, message = _validate_vertical(
+            vertical, stations, curve_lengths, k_values, curve_types)
+        self.report({report_type}, message)
+        return {'FINISHED'}
+
+
+class BC_OT_RebuildVertical(Operator):
+    """Recalculate grades, segments and validation in one step"""
+    bl_idname = "bc.rebuild_vertical"
+    bl_label = "Rebuild"
+    bl_description = "Recalculate grades, regenerate segments and validate the vertical alignment"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        vertical = context.scene.bc_vertical
+        return len(vertical.pvis) >= 2
+    
+    def execute(self, context):
+        report_type, message = rebuild_vertical(context.scene.bc_vertical)
+        self.report({report_type}, message)
         return {'FINISHED'}
 
 
@@ -531,40 +737,65 @@ class BC_OT_QueryStation(Operator):
         vertical = context.scene.bc_vertical
         station = vertical.query_station
         
-        # Find segment containing station
-        found = False
-        for seg in vertical.segments:
-            if seg.start_station <= station <= seg.end_station:
-                found = True
-                
-                # Calculate elevation and grade
-                x = station - seg.start_station
-                length = seg.length
-                
-                if seg.segment_type == "TANGENT":
-                    # Linear interpolation
-                    t = x / length if length > 0 else 0
-                    elevation = seg.start_elevation + t * (seg.end_elevation - seg.start_elevation)
-                    grade = seg.grade
-                else:
-                    # Curve segment (simplified - use average)
-                    t = x / length if length > 0 else 0
-                    elevation = seg.start_elevation + t * (seg.end_elevation - seg.start_elevation)
-                    grade = seg.grade
-                
-                vertical.query_elevation = elevation
-                vertical.query_grade = grade
-                vertical.query_grade_percent = grade * 100
-                
-                self.report({'INFO'}, 
-                    f"Station {station:.3f}m: Elev={elevation:.3f}m, Grade={grade*100:.2f}%")
-                break
+        elevations, grades, found = _query_segments(vertical.segments, np.array([station]))
+        elevation = float(elevations[0])
+        grade = float(grades[0])
+        
+        vertical.query_elevation = elevation
+        vertical.query_grade = grade
+        vertical.query_grade_percent = grade * 100
         
-        if not found:
+        if found[0]:
+            self.report({'INFO'}, 
+                f"Station {station:.3f}m: Elev={elevation:.3f}m, Grade={grade*100:.2f}%")
+        else:
             self.report({'WARNING'}, f"Station {station:.3f}m not in alignment range")
-            vertical.query_elevation = 0.0
-            vertical.query_grade = 0.0
-            vertical.query_grade_percent = 0.0
+        
+        return {'FINISHED'}
+
+
+class BC_OT_QueryStationsBatch(Operator):
+    """Query elevation and grade at many stations in one call"""
+    bl_idname = "bc.query_stations_batch"
+    bl_label = "Query Stations"
+    bl_description = "Get elevation and grade at a list of stations"
+    bl_options = {'REGISTER'}
+    
+    stations_csv: StringProperty(
+        name="Stations",
+        description="Comma-separated stations to query (m)",
+        default="",
+    )
+    
+    @classmethod
+    def poll(cls, context):
+        vertical = context.scene.bc_vertical
+        return len(vertical.pvis) >= 2
+    
+    def execute(self, context):
+        vertical = context.scene.bc_vertical
+        
+        try:
+            stations = np.array([float(value) for value in self.stations_csv.split(",")
+                                 if value.strip()])
+        except ValueError:
+            self.report({'ERROR'}, f"Invalid station list: {self.stations_csv}")
+            return {'CANCELLED'}
+        
+        elevations, grades, found = _query_segments(vertical.segments, stations)
+        
+        # Store results, one foreach_set per field
+        results = vertical.query_results
+        results.clear()
+        for _ in range(len(stations)):
+            results.add()
+        _write_float_fields(results, station=stations, elevation=elevations, grade=grades)
+        
+        missing = len(stations) - int(found.sum())
+        if missing:
+            self.report({'WARNING'}, f"{missing} of {len(stations)} stations not in alignment range")
+        else:
+            self.report({'INFO'}, f"Queried {len(stations)} stations")
         
         return {'FINISHED'}
 
@@ -814,7 +1045,9 @@ classes = (
     BC_OT_CalculateGrades,
     BC_OT_GenerateSegments,
     BC_OT_ValidateVertical,
+    BC_OT_RebuildVertical,
     BC_OT_QueryStation,
+    BC_OT_QueryStationsBatch,
     BC_OT_TraceTerrainAsVertical,
     BC_OT_ClearVerticalAlignment,
     BC_OT_SelectVerticalAlignment,
@@ -831,6 +1064,11 @@ def register():
 
 def unregister():
     """Unregister operator classes"""
+    # Drop any rebuild still waiting on its timer
+    if bpy.app.timers.is_registered(_run_pending_rebuilds):
+        bpy.app.timers.unregister(_run_pending_rebuilds)
+    _pending_rebuilds.clear()
+    
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     
@@ -222,9 +222,7 @@ class VIEW3D_PT_bc_vertical_pvi_list(Panel):
         
         # Quick Actions
         layout.separator()
-        row = layout.row(align=True)
-        row.operator("bc.calculate_grades", icon='FILE_REFRESH')
-        row.operator("bc.generate_segments", icon='MOD_ARRAY')
+        layout.operator("bc.rebuild_vertical", icon='FILE_REFRESH')
         
         layout.operator("bc.clear_vertical", icon='X')
 
@@ -34,6 +34,18 @@ from bpy.props import (
     EnumProperty,
 )
 
+from ..operators.vertical_operators import schedule_rebuild
+
+
+def _update_pvi_geometry(self, context):
+    """
+    Update callback for PVI station, elevation and curve length.
+    Schedules a debounced rebuild of grades, segments and validation.
+    """
+    if context.scene is None:
+        return
+    schedule_rebuild(context.scene)
+
 
 class PVIProperties(PropertyGroup):
     """Properties for a single PVI (Point of Vertical Intersection)"""
@@ -46,6 +58,7 @@ class PVIProperties(PropertyGroup):
         min=0.0,
         precision=3,
         unit='LENGTH',
+        update=_update_pvi_geometry,
     )
     
     elevation: FloatProperty(
@@ -54,6 +67,7 @@ class PVIProperties(PropertyGroup):
         default=0.0,
         precision=3,
         unit='LENGTH',
+        update=_update_pvi_geometry,
     )
     
     # Curve properties
@@ -64,6 +78,7 @@ class PVIProperties(PropertyGroup):
         min=0.0,
         precision=2,
         unit='LENGTH',
+        update=_update_pvi_geometry,
     )
     
     # Calculated properties (read-only in UI)
@@ -178,6 +193,31 @@ class VerticalSegmentProperties(PropertyGroup):
     )
 
 
+class VerticalQueryResultProperties(PropertyGroup):
+    """Elevation and grade at one station of a batch query"""
+    
+    station: FloatProperty(
+        name="Station",
+        description="Queried station (m)",
+        default=0.0,
+        precision=3,
+    )
+    
+    elevation: FloatProperty(
+        name="Elevation",
+        description="Elevation at station (m)",
+        default=0.0,
+        precision=3,
+    )
+    
+    grade: FloatProperty(
+        name="Grade",
+        description="Grade at station (decimal)",
+        default=0.0,
+        precision=4,
+    )
+
+
 class VerticalAlignmentProperties(PropertyGroup):
     """Main vertical alignment properties"""
     
@@ -314,6 +354,12 @@ class VerticalAlignmentProperties(PropertyGroup):
         precision=2,
     )
     
+    query_results: CollectionProperty(
+        type=VerticalQueryResultProperties,
+        name="Query Results",
+        description="Results of the last batch station query",
+    )
+    
     # UI state
     show_pvi_list: BoolProperty(
         name="Show PVI List",
@@ -365,6 +411,7 @@ class VerticalAlignmentProperties(PropertyGroup):
 classes = (
     PVIProperties,
     VerticalSegmentProperties,
+    VerticalQueryResultProperties,
     VerticalAlignmentProperties,
 )
 
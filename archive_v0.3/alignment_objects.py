@@ -11,8 +11,29 @@ Date: October 24, 2025
 
 import bpy
 import math
+import numpy as np
 from mathutils import Vector
 
+try:
+    from . import preferences
+except ImportError:
+    import preferences
+
+
+def _input_key(values):
+    """
+    Key for the inputs an element's geometry was computed from.
+    
+    The exact bytes of the values as float64, so any change to a PI
+    location or radius produces a different key.
+    """
+    return np.asarray(values, dtype=np.float64).tobytes().hex()
+
+
+def get_horizontal_collection(alignment_root):
+    """Horizontal layout collection of an alignment root, or None"""
+    return bpy.data.collections.get(alignment_root.name + "_Horizontal")
+
 
 def create_alignment_root(name="Alignment_01", alignment_type='CENTERLINE', design_speed=35.0):
     """
@@ -40,6 +61,7 @@ def create_alignment_root(name="Alignment_01", alignment_type='CENTERLINE', desi
     props.alignment_type = alignment_type
     props.design_speed = design_speed
     props.auto_update_enabled = True
+    props.element_refs_complete = True
     
     # Create collection structure (IFC-style hierarchy)
     collection_name = f"{name}_Collection"
@@ -58,7 +80,8 @@ def create_alignment_root(name="Alignment_01", alignment_type='CENTERLINE', desi
     # Link root to main alignment collection
     align_col.objects.link(root)
     
-    print(f"âœ“ Created alignment root: {name}")
+    if preferences.is_debug():
+        print(f"âœ“ Created alignment root: {name}")
     return root
 
 
@@ -97,15 +120,15 @@ def create_pi_point(name, location, index, alignment_root, radius=500.0, design_
     props.alignment_root = alignment_root
     
     # Add to horizontal layout collection
-    h_layout_name = f"{alignment_root.name}_Horizontal"
-    if h_layout_name in bpy.data.collections:
-        collection = bpy.data.collections[h_layout_name]
+    collection = get_horizontal_collection(alignment_root)
+    if collection is not None:
         collection.objects.link(empty)
     else:
         # Fallback to scene collection
         bpy.context.scene.collection.objects.link(empty)
     
-    print(f"âœ“ Created PI: {name} at index {index}")
+    if preferences.is_debug():
+        print(f"âœ“ Created PI: {name} at index {index}")
     return empty
 
 
@@ -173,6 +196,7 @@ def create_tangent_line(name, pi_start, pi_end, alignment_root):
     props.pi_end = pi_end
     props.length = length
     props.bearing = bearing
+    props.input_hash = _input_key((*pi_start.location, *pi_end.location))
     
     # Update PI references
     if pi_start:
@@ -180,18 +204,87 @@ def create_tangent_line(name, pi_start, pi_end, alignment_root):
     if pi_end:
         pi_end.alignment_pi.tangent_in = obj
     
+    # Register with the alignment root
+    alignment_root.alignment_root.tangent_refs.add().obj = obj
+    
     # Add to horizontal layout collection
-    h_layout_name = f"{alignment_root.name}_Horizontal"
-    if h_layout_name in bpy.data.collections:
-        collection = bpy.data.collections[h_layout_name]
+    collection = get_horizontal_collection(alignment_root)
+    if collection is not None:
         collection.objects.link(obj)
     else:
         bpy.context.scene.collection.objects.link(obj)
     
-    print(f"âœ“ Created tangent: {name}, length={length:.2f}, bearing={math.degrees(bearing):.2f}Â°")
+    if preferences.is_debug():
+        print(f"âœ“ Created tangent: {name}, length={length:.2f}, bearing={math.degrees(bearing):.2f}Â°")
     return obj
 
 
+def _curve_geometry(pi_loc, prev_loc, next_loc, radius):
+    """
+    Circular curve geometry at one or more PIs, as plain floats and arrays.
+    
+    Pure-math kernel shared by create_curve and update_curves_geometry; it
+    touches no Blender data, so callers read the PI locations once and
+    write the results back themselves. Locations may be single (3,)
+    vectors or (N, 3) arrays with a matching (N,) radius array, in which
+    case every curve is computed in one vectorized pass.
+    
+    Args:
+        pi_loc: PI location(s)
+        prev_loc: Previous PI location(s)
+        next_loc: Next PI location(s)
+        radius: Curve radius (or radii)
+    
+    Returns:
+        Tuple of (deflection, tangent_length, center, start_angle), where
+        center is the 2D arc center and start_angle the angle of the PC
+        about it
+    """
+    radius = np.asarray(radius, dtype=np.float64)
+    v_in = pi_loc - prev_loc
+    v_out = next_loc - pi_loc
+    # Normalize, leaving zero-length vectors as they are like Vector does
+    for v in (v_in, v_out):
+        length = np.sqrt(np.einsum('...i,...i->...', v, v))[..., None]
+        np.divide(v, length, out=v, where=length > 0.0)
+    
+    # Calculate deflection angle (change in direction)
+    # Using 2D cross product for sign and dot product for magnitude
+    cross = v_in[..., 0] * v_out[..., 1] - v_in[..., 1] * v_out[..., 0]
+    deflection = np.arctan2(cross, np.einsum('...i,...i->...', v_in, v_out))
+    
+    tangent_length = radius * np.tan(np.abs(deflection) / 2)
+    
+    # Curve center: perpendicular to incoming tangent, offset by radius
+    angle_in = np.arctan2(v_in[..., 1], v_in[..., 0])
+    offset_angle = angle_in + np.where(deflection > 0, math.pi/2, -math.pi/2)
+    center = (pi_loc[..., :2] - tangent_length[..., None] * v_in[..., :2]
+              + radius[..., None] * np.stack((np.cos(offset_angle), np.sin(offset_angle)), axis=-1))
+    
+    # PC (Point of Curvature) and its angle about the center
+    pc = pi_loc - tangent_length[..., None] * v_in
+    start_angle = np.arctan2(pc[..., 1] - center[..., 1], pc[..., 0] - center[..., 0])
+    
+    return deflection, tangent_length, center, start_angle
+
+
+def _arc_points(center, radius, start_angle, deflection, z, num_points):
+    """
+    Sample a circular arc as a flat spline point buffer.
+    
+    Returns:
+        float32 array of num_points (x, y, z, w) rows, flattened for
+        spline.points.foreach_set("co", ...)
+    """
+    angles = start_angle + np.linspace(0.0, 1.0, num_points) * deflection
+    co = np.empty((num_points, 4), dtype=np.float32)
+    co[:, 0] = center[0] + radius * np.cos(angles)
+    co[:, 1] = center[1] + radius * np.sin(angles)
+    co[:, 2] = z  # Keep same elevation for now
+    co[:, 3] = 1.0
+    return co.ravel()
+
+
 def create_curve(name, pi, pi_prev, pi_next, radius, alignment_root, sample_interval=5.0):
     """
     Create a circular curve object at a PI.
@@ -212,39 +305,16 @@ def create_curve(name, pi, pi_prev, pi_next, radius, alignment_root, sample_inte
     Returns:
         Curve object with alignment_curve properties, or None if no curve needed
     """
-    # Calculate tangent directions
-    v_in = (Vector(pi.location) - Vector(pi_prev.location)).normalized()
-    v_out = (Vector(pi_next.location) - Vector(pi.location)).normalized()
-    
-    # Calculate deflection angle (change in direction)
-    # Using 2D cross product for sign and dot product for magnitude
-    cross = v_in.x * v_out.y - v_in.y * v_out.x
-    dot = v_in.dot(v_out)
-    deflection = math.atan2(cross, dot)
+    # Calculate deflection, tangent length and curve center
+    pi_loc = np.array(pi.location)
+    deflection, _, center, start_angle = _curve_geometry(
+        pi_loc, np.array(pi_prev.location), np.array(pi_next.location), radius)
     
     # If deflection is too small, no curve needed (straight line)
     if abs(deflection) < 0.001:  # ~0.06 degrees
         print(f"  âš  Skipping curve at {name}: deflection too small ({math.degrees(deflection):.3f}Â°)")
         return None
     
-    # Calculate tangent length
-    tangent_length = radius * math.tan(abs(deflection) / 2)
-    
-    # Calculate curve center
-    # Perpendicular to incoming tangent, offset by radius
-    angle_in = math.atan2(v_in.y, v_in.x)
-    offset_angle = angle_in + math.pi/2 if deflection > 0 else angle_in - math.pi/2
-    
-    center = Vector(pi.location) - Vector((
-        tangent_length * v_in.x,
-        tangent_length * v_in.y,
-        0
-    )) + Vector((
-        radius * math.cos(offset_angle),
-        radius * math.sin(offset_angle),
-        0
-    ))
-    
     # Create curve data
     curve_data = bpy.data.curves.new(name, 'CURVE')
     curve_data.dimensions = '3D'
@@ -256,21 +326,9 @@ def create_curve(name, pi, pi_prev, pi_next, radius, alignment_root, sample_inte
     
     spline.points.add(num_points - 1)  # Add remaining points
     
-    # Calculate PC (Point of Curvature) location
-    pc = Vector(pi.location) - tangent_length * v_in
-    
     # Generate curve points
-    start_angle = math.atan2(pc.y - center.y, pc.x - center.x)
-    
-    for i in range(num_points):
-        t = i / (num_points - 1)
-        angle = start_angle + t * deflection
-        
-        x = center.x + radius * math.cos(angle)
-        y = center.y + radius * math.sin(angle)
-        z = pi.location.z  # Keep same elevation for now
-        
-        spline.points[i].co = (x, y, z, 1)
+    spline.points.foreach_set("co", _arc_points(
+        center, radius, start_angle, deflection, pi_loc[2], num_points))
     
     # Create object
     obj = bpy.data.objects.new(name, curve_data)
@@ -298,22 +356,24 @@ def create_curve(name, pi, pi_prev, pi_next, radius, alignment_root, sample_inte
     props.pi = pi
     props.radius = radius
     props.delta_angle = deflection
-    props.length = arc_length
-    props.tangent_length = tangent_length
+    props.input_hash = _input_key((*pi_prev.location, *pi_loc, *pi_next.location, radius))
     
     # Update PI reference
     if pi:
         pi.alignment_pi.curve = obj
     
+    # Register with the alignment root
+    alignment_root.alignment_root.curve_refs.add().obj = obj
+    
     # Add to horizontal layout collection
-    h_layout_name = f"{alignment_root.name}_Horizontal"
-    if h_layout_name in bpy.data.collections:
-        collection = bpy.data.collections[h_layout_name]
+    collection = get_horizontal_collection(alignment_root)
+    if collection is not None:
         collection.objects.link(obj)
     else:
         bpy.context.scene.collection.objects.link(obj)
     
-    print(f"âœ“ Created curve: {name}, R={radius:.2f}, Î”={math.degrees(deflection):.2f}Â°, L={arc_length:.2f}")
+    if preferences.is_debug():
+        print(f"âœ“ Created curve: {name}, R={radius:.2f}, Î”={math.degrees(deflection):.2f}Â°, L={arc_length:.2f}")
     return obj
 
 
@@ -338,6 +398,11 @@ def update_tangent_geometry(tangent_obj):
     if not curve_data or not curve_data.splines:
         return
     
+    # Nothing to do if neither PI has moved since the last update
+    key = _input_key((*props.pi_start.location, *props.pi_end.location))
+    if props.input_hash == key:
+        return
+    
     spline = curve_data.splines[0]
     
     # Update point locations
@@ -351,8 +416,70 @@ def update_tangent_geometry(tangent_obj):
     dx = props.pi_end.location.x - props.pi_start.location.x
     dy = props.pi_end.location.y - props.pi_start.location.y
     props.bearing = math.atan2(dx, dy)
+    props.input_hash = key
+    
+    if preferences.is_debug():
+        print(f"  âœ“ Updated tangent: {tangent_obj.name}, new length={props.length:.2f}")
+
+
+def update_tangents_geometry(tangent_objs):
+    """
+    Update the geometry of several tangent lines at once.
+    
+    Batch form of update_tangent_geometry: the PI locations of all tangents
+    are gathered into arrays so lengths and bearings come from a single
+    vectorized pass instead of per-tangent Vector and atan2 calls.
     
-    print(f"  âœ“ Updated tangent: {tangent_obj.name}, new length={props.length:.2f}")
+    Args:
+        tangent_objs: Tangent objects to update
+    
+    Returns:
+        Number of tangents updated
+    """
+    valid = []
+    for tangent_obj in tangent_objs:
+        props = tangent_obj.alignment_tangent
+        if not props.pi_start or not props.pi_end:
+            print(f"  âš  Cannot update {tangent_obj.name}: missing PI references")
+            continue
+        curve_data = tangent_obj.data
+        if not curve_data or not curve_data.splines:
+            continue
+        valid.append(tangent_obj)
+    
+    if not valid:
+        return 0
+    
+    starts = np.array([obj.alignment_tangent.pi_start.location for obj in valid])
+    ends = np.array([obj.alignment_tangent.pi_end.location for obj in valid])
+    
+    # Skip tangents whose PIs have not moved since the last update
+    keys = [_input_key(row) for row in np.hstack((starts, ends))]
+    changed = [i for i, (obj, key) in enumerate(zip(valid, keys))
+               if obj.alignment_tangent.input_hash != key]
+    if not changed:
+        return 0
+    
+    valid = [valid[i] for i in changed]
+    keys = [keys[i] for i in changed]
+    starts, ends = starts[changed], ends[changed]
+    vecs = ends - starts
+    lengths = np.sqrt(np.einsum('ij,ij->i', vecs, vecs))
+    bearings = np.arctan2(vecs[:, 0], vecs[:, 1])  # Angle from +Y
+    
+    for tangent_obj, start, end, length, bearing, key in zip(valid, starts, ends, lengths, bearings, keys):
+        spline = tangent_obj.data.splines[0]
+        spline.points[0].co = (*start, 1)
+        spline.points[1].co = (*end, 1)
+        
+        props = tangent_obj.alignment_tangent
+        props.length = length
+        props.bearing = bearing
+        props.input_hash = key
+    
+    if preferences.is_debug():
+        print(f"  âœ“ Updated {len(valid)} tangents")
+    return len(valid)
 
 
 def update_curve_geometry(curve_obj):
@@ -365,87 +492,184 @@ def update_curve_geometry(curve_obj):
     Args:
         curve_obj: Curve object to update
     """
-    props = curve_obj.alignment_curve
-    
-    if not props.pi:
-        print(f"  âš  Cannot update {curve_obj.name}: missing PI reference")
-        return
+    update_curves_geometry([curve_obj])
+
+
+def update_curves_geometry(curve_objs):
+    """
+    Update the geometry of several curves at once.
     
-    # Get adjacent PI objects from tangents
-    pi = props.pi
-    tangent_in = pi.alignment_pi.tangent_in
-    tangent_out = pi.alignment_pi.tangent_out
+    Batch form of update_curve_geometry. The inputs of every curve are
+    read first, the curve math for all of them runs in one vectorized
+    _curve_geometry pass, and the results are then written back curve by
+    curve, so callers can gather curves across alignments into one call.
     
-    if not tangent_in or not tangent_out:
-        print(f"  âš  Cannot update {curve_obj.name}: missing tangent references")
-        return
-    
-    pi_prev = tangent_in.alignment_tangent.pi_start
-    pi_next = tangent_out.alignment_tangent.pi_end
+    Args:
+        curve_objs: Curve objects to update
     
-    if not pi_prev or not pi_next:
-        print(f"  âš  Cannot update {curve_obj.name}: missing adjacent PIs")
-        return
+    Returns:
+        Number of curves updated
+    """
+    # Read phase: resolve each curve's PIs and skip those not moved
+    valid, locs, radii, keys = [], [], [], []
+    for curve_obj in curve_objs:
+        props = curve_obj.alignment_curve
+        
+        if not props.pi:
+            print(f"  âš  Cannot update {curve_obj.name}: missing PI reference")
+            continue
+        
+        # Get adjacent PI objects from tangents
+        pi = props.pi
+        tangent_in = pi.alignment_pi.tangent_in
+        tangent_out = pi.alignment_pi.tangent_out
+        
+        if not tangent_in or not tangent_out:
+            print(f"  âš  Cannot update {curve_obj.name}: missing tangent references")
+            continue
+        
+        pi_prev = tangent_in.alignment_tangent.pi_start
+        pi_next = tangent_out.alignment_tangent.pi_end
+        
+        if not pi_prev or not pi_next:
+            print(f"  âš  Cannot update {curve_obj.name}: missing adjacent PIs")
+            continue
+        
+        # Nothing to do if no PI has moved and the radius is unchanged
+        radius = props.radius
+        loc = (*pi_prev.location, *pi.location, *pi_next.location)
+        key = _input_key((*loc, radius))
+        if props.input_hash == key:
+            continue
+        
+        valid.append(curve_obj)
+        locs.append(loc)
+        radii.append(radius)
+        keys.append(key)
+    
+    if not valid:
+        return 0
+    
+    # Compute phase: recalculate all curves using same logic as create_curve
+    locs = np.array(locs).reshape(-1, 3, 3)
+    radii = np.array(radii)
+    deflections, _, centers, start_angles = _curve_geometry(
+        locs[:, 1], locs[:, 0], locs[:, 2], radii)
+    
+    # Write phase
+    updated = 0
+    for i, curve_obj in enumerate(valid):
+        deflection = deflections[i]
+        if abs(deflection) < 0.001:
+            # No curve needed anymore - could delete it
+            print(f"  âš  {curve_obj.name}: deflection now too small, consider removing")
+            continue
+        
+        # Update curve geometry
+        curve_data = curve_obj.data
+        if not curve_data or not curve_data.splines:
+            continue
+        
+        spline = curve_data.splines[0]
+        
+        # Regenerate the existing points along the new arc
+        spline.points.foreach_set("co", _arc_points(
+            centers[i], radii[i], start_angles[i], deflection, locs[i, 1, 2],
+            len(spline.points)))
+        
+        # Update properties
+        props = curve_obj.alignment_curve
+        props.delta_angle = deflection
+        props.input_hash = keys[i]
+        updated += 1
+        
+        if preferences.is_debug():
+            print(f"  âœ“ Updated curve: {curve_obj.name}, new Î”={math.degrees(deflection):.2f}Â°, L={props.length:.2f}")
     
-    # Recalculate curve using same logic as create_curve
-    v_in = (Vector(pi.location) - Vector(pi_prev.location)).normalized()
-    v_out = (Vector(pi_next.location) - Vector(pi.location)).normalized()
+    return updated
+
+
+def get_alignment_roots(scene):
+    """
+    Get the alignment root objects in a scene.
     
-    cross = v_in.x * v_out.y - v_in.y * v_out.x
-    dot = v_in.dot(v_out)
-    deflection = math.atan2(cross, dot)
+    The scene is scanned on every call. Object references must not be
+    kept between operator runs: undo and file loads reallocate every ID,
+    so a cached list would hold freed objects.
     
-    if abs(deflection) < 0.001:
-        # No curve needed anymore - could delete it
-        print(f"  âš  {curve_obj.name}: deflection now too small, consider removing")
-        return
+    Args:
+        scene: Scene to search
     
-    radius = props.radius
-    tangent_length = radius * math.tan(abs(deflection) / 2)
-    
-    # Calculate curve center
-    angle_in = math.atan2(v_in.y, v_in.x)
-    offset_angle = angle_in + math.pi/2 if deflection > 0 else angle_in - math.pi/2
-    
-    center = Vector(pi.location) - Vector((
-        tangent_length * v_in.x,
-        tangent_length * v_in.y,
-        0
-    )) + Vector((
-        radius * math.cos(offset_angle),
-        radius * math.sin(offset_angle),
-        0
-    ))
-    
-    # Update curve geometry
-    curve_data = curve_obj.data
-    if not curve_data or not curve_data.splines:
-        return
+    Returns:
+        List of alignment root objects
+    """
+    return [obj for obj in scene.objects
+            if obj.type == 'EMPTY' and hasattr(obj, 'alignment_root')
+            and obj.alignment_root.object_type == 'ALIGNMENT_ROOT']
+
+
+def classify_elements(collection):
+    """
+    Split a horizontal layout collection into PIs, tangents and curves.
     
-    spline = curve_data.splines[0]
+    Walks collection.objects once instead of once per element type. Each
+    test is independent, exactly as the per-type comprehensions were.
     
-    # Calculate PC location and generate points
-    pc = Vector(pi.location) - tangent_length * v_in
-    start_angle = math.atan2(pc.y - center.y, pc.x - center.x)
+    Returns:
+        Tuple of (pis, tangents, curves) object lists
+    """
+    pis, tangents, curves = [], [], []
+    for obj in collection.objects:
+        props = getattr(obj, 'alignment_pi', None)
+        if props is not None and props.object_type == 'ALIGNMENT_PI':
+            pis.append(obj)
+        props = getattr(obj, 'alignment_tangent', None)
+        if props is not None and props.object_type == 'ALIGNMENT_TANGENT':
+            tangents.append(obj)
+        props = getattr(obj, 'alignment_curve', None)
+        if props is not None and props.object_type == 'ALIGNMENT_CURVE':
+            curves.append(obj)
+    return pis, tangents, curves
+
+
+def get_alignment_elements(alignment_root, collection):
+    """
+    Get the tangent and curve objects of an alignment.
     
-    num_points = len(spline.points)
-    for i in range(num_points):
-        t = i / (num_points - 1)
-        angle = start_angle + t * deflection
-        
-        x = center.x + radius * math.cos(angle)
-        y = center.y + radius * math.sin(angle)
-        z = pi.location.z
-        
-        spline.points[i].co = (x, y, z, 1)
+    Read from the element references on the alignment root. References to
+    deleted objects read as None and are removed. Alignments created
+    before the references existed may hold references to only the
+    elements added since, so the first call classifies their horizontal
+    layout collection and stores references to every element.
     
-    # Update properties
-    arc_length = abs(radius * deflection)
-    props.delta_angle = deflection
-    props.length = arc_length
-    props.tangent_length = tangent_length
+    Args:
+        alignment_root: Root alignment object
+        collection: Horizontal layout collection of that alignment
     
-    print(f"  âœ“ Updated curve: {curve_obj.name}, new Î”={math.degrees(deflection):.2f}Â°, L={arc_length:.2f}")
+    Returns:
+        Tuple of (tangents, curves) object lists
+    """
+    props = alignment_root.alignment_root
+    if not props.element_refs_complete:
+        _, tangents, curves = classify_elements(collection)
+        props.tangent_refs.clear()
+        props.curve_refs.clear()
+        for obj in tangents:
+            props.tangent_refs.add().obj = obj
+        for obj in curves:
+            props.curve_refs.add().obj = obj
+        props.element_refs_complete = True
+        return tangents, curves
+    
+    return _live_refs(props.tangent_refs), _live_refs(props.curve_refs)
+
+
+def _live_refs(refs):
+    """Remove references to deleted objects and return the remaining objects."""
+    for i in reversed(range(len(refs))):
+        if refs[i].obj is None:
+            refs.remove(i)
+    return [ref.obj for ref in refs]
 
 
 def update_stations(alignment_root):
@@ -459,51 +683,40 @@ def update_stations(alignment_root):
         alignment_root: Root alignment object
     """
     # Get horizontal layout collection
-    h_layout_name = f"{alignment_root.name}_Horizontal"
-    if h_layout_name not in bpy.data.collections:
+    collection = get_horizontal_collection(alignment_root)
+    if collection is None:
         return
     
-    collection = bpy.data.collections[h_layout_name]
-    
-    # Find all tangents and curves, sort by their PI indices
+    # Find all tangents and curves with their start PIs, sort by PI index
     elements = []
     for obj in collection.objects:
         if hasattr(obj, 'alignment_tangent') and obj.alignment_tangent.object_type == 'ALIGNMENT_TANGENT':
-            elements.append(('tangent', obj))
+            props = obj.alignment_tangent
+            elements.append((props, props.pi_start))
         elif hasattr(obj, 'alignment_curve') and obj.alignment_curve.object_type == 'ALIGNMENT_CURVE':
-            elements.append(('curve', obj))
+            props = obj.alignment_curve
+            elements.append((props, props.pi))
     
-    # Sort elements by start PI index
-    def get_start_index(elem):
-        elem_type, obj = elem
-        if elem_type == 'tangent':
-            pi = obj.alignment_tangent.pi_start
-            return pi.alignment_pi.index if pi else 999
-        else:  # curve
-            pi = obj.alignment_curve.pi
-            return pi.alignment_pi.index if pi else 999
+    elements.sort(key=lambda elem: elem[1].alignment_pi.index if elem[1] else 999)
     
-    elements.sort(key=get_start_index)
+    # Calculate cumulative stations in one pass over the element lengths;
+    # each element starts where the previous one ends
+    lengths = np.fromiter((props.length for props, _ in elements),
+                          dtype=np.float64, count=len(elements))
+    ends = np.cumsum(lengths)
+    starts = np.concatenate(([0.0], ends[:-1]))
     
-    # Calculate cumulative stations
-    current_station = 0.0
+    for (props, _), start_station, end_station in zip(elements, starts.tolist(), ends.tolist()):
+        props.start_station = start_station
+        props.end_station = end_station
     
-    for elem_type, obj in elements:
-        if elem_type == 'tangent':
-            props = obj.alignment_tangent
-            props.start_station = current_station
-            props.end_station = current_station + props.length
-            current_station += props.length
-        else:  # curve
-            props = obj.alignment_curve
-            props.start_station = current_station
-            props.end_station = current_station + props.length
-            current_station += props.length
+    current_station = float(ends[-1]) if len(ends) else 0.0
     
     # Update total length on root
     alignment_root.alignment_root.total_length = current_station
     
-    print(f"  âœ“ Updated stations: total length = {current_station:.2f}")
+    if preferences.is_debug():
+        print(f"  âœ“ Updated stations: total length = {current_station:.2f}")
 
 
 # Test function
@@ -15,8 +15,10 @@ from bpy.app.handlers import persistent
 # Import our object update functions
 try:
     from . import alignment_objects as align_obj
+    from . import preferences
 except ImportError:
     import alignment_objects as align_obj
+    import preferences
 
 
 # Store previous PI positions to detect actual movement
@@ -39,15 +41,13 @@ def alignment_auto_update_handler(scene, depsgraph):
     global _pi_positions
     
     # Find all alignment roots in scene
-    alignment_roots = [obj for obj in scene.objects
-                      if obj.type == 'EMPTY' and hasattr(obj, 'alignment_root')
-                      and obj.alignment_root.object_type == 'ALIGNMENT_ROOT']
+    alignment_roots = align_obj.get_alignment_roots(scene)
     
     if not alignment_roots:
         return
     
-    # Track which alignments need updating
-    alignments_to_update = set()
+    # Track which alignments need updating, with their tangents and curves
+    alignments_to_update = {}
     
     # Check each alignment
     for alignment_root in alignment_roots:
@@ -56,16 +56,12 @@ def alignment_auto_update_handler(scene, depsgraph):
             continue
         
         # Get horizontal layout collection
-        h_layout_name = f"{alignment_root.name}_Horizontal"
-        if h_layout_name not in bpy.data.collections:
+        collection = align_obj.get_horizontal_collection(alignment_root)
+        if collection is None:
             continue
         
-        collection = bpy.data.collections[h_layout_name]
-        
         # Check all PI points for movement
-        pis = [obj for obj in collection.objects
-              if hasattr(obj, 'alignment_pi')
-              and obj.alignment_pi.object_type == 'ALIGNMENT_PI']
+        pis, tangents, curves = align_obj.classify_elements(collection)
         
         for pi in pis:
             pi_id = pi.name
@@ -79,41 +75,31 @@ def alignment_auto_update_handler(scene, depsgraph):
                 moved = any(abs(current_loc[i] - prev_loc[i]) > 0.0001 for i in range(3))
                 
                 if moved:
-                    # PI has moved - mark this alignment for update
-                    alignments_to_update.add(alignment_root)
-                    print(f"  âš¡ PI moved: {pi.name} from {prev_loc} to {current_loc}")
+                    # PI has moved - mark this alignment for update, keeping
+                    # the elements classified above for the rebuild
+                    alignments_to_update[alignment_root] = (tangents, curves)
+                    if preferences.is_debug():
+                        print(f"  âš¡ PI moved: {pi.name} from {prev_loc} to {current_loc}")
             
             # Update stored position
             _pi_positions[pi_id] = current_loc
     
     # Update affected alignments
-    for alignment_root in alignments_to_update:
-        print(f"\nâš¡ AUTO-UPDATE: {alignment_root.name}")
-        
-        # Get horizontal layout collection
-        h_layout_name = f"{alignment_root.name}_Horizontal"
-        collection = bpy.data.collections[h_layout_name]
+    for alignment_root, (tangents, curves) in alignments_to_update.items():
+        if preferences.is_debug():
+            print(f"\nâš¡ AUTO-UPDATE: {alignment_root.name}")
         
         # Update all tangents
-        tangents = [obj for obj in collection.objects
-                   if hasattr(obj, 'alignment_tangent')
-                   and obj.alignment_tangent.object_type == 'ALIGNMENT_TANGENT']
-        
-        for tangent in tangents:
-            align_obj.update_tangent_geometry(tangent)
+        align_obj.update_tangents_geometry(tangents)
         
         # Update all curves
-        curves = [obj for obj in collection.objects
-                 if hasattr(obj, 'alignment_curve')
-                 and obj.alignment_curve.object_type == 'ALIGNMENT_CURVE']
-        
-        for curve in curves:
-            align_obj.update_curve_geometry(curve)
+        align_obj.update_curves_geometry(curves)
         
         # Recalculate stations
         align_obj.update_stations(alignment_root)
         
-        print(f"âœ“ Auto-updated {len(tangents)} tangents and {len(curves)} curves")
+        if preferences.is_debug():
+            print(f"âœ“ Auto-updated {len(tangents)} tangents and {len(curves)} curves")
 
 
 def clear_position_cache():
@@ -13,13 +13,133 @@ import bpy
 from bpy.types import Operator
 from bpy.props import FloatProperty, StringProperty
 from mathutils import Vector
-import math
+from operator import itemgetter
+import sys
+import numpy as np
 
 # Import our object creation functions
 try:
     from . import alignment_objects as align_obj
+    from . import preferences
+    from .properties import CURVE_RADIUS_KWARGS
 except ImportError:
     import alignment_objects as align_obj
+    import preferences
+    from properties import CURVE_RADIUS_KWARGS
+
+
+# Row templates for the analysis report, parsed once at import instead of
+# rebuilding an f-string for every element
+_PI_ROW = ("  {name:10s} | Index: {index:2d} | "
+           "Location: ({x:7.2f}, {y:7.2f}, {z:7.2f}) | "
+           "Radius: {radius:6.1f}")
+_TANGENT_ROW = ("  TANGENT  | {name:15s} | "
+                "Sta {start:8.2f} - {end:8.2f} | "
+                "Length: {length:8.2f} | "
+                "Bearing: {bearing:7.2f}Â° | "
+                "Constraint: {constraint}")
+_CURVE_ROW = ("  CURVE    | {name:15s} | "
+              "Sta {start:8.2f} - {end:8.2f} | "
+              "Length: {length:8.2f} | "
+              "R={radius:6.1f} | "
+              "Î”={delta:6.2f}Â° | "
+              "T={tangent:6.2f} | "
+              "Constraint: {constraint}")
+
+# Shorter rows for the summary printed after creating an alignment
+_SUMMARY_TANGENT_ROW = ("  TANGENT  | {name:15s} | "
+                        "Sta {start:7.2f} - {end:7.2f} | L={length:7.2f}")
+_SUMMARY_CURVE_ROW = ("  CURVE    | {name:15s} | "
+                      "Sta {start:7.2f} - {end:7.2f} | L={length:7.2f} | "
+                      "R={radius:.1f} | Î”={delta:.1f}Â°")
+
+
+def _elements_by_station(tangents, curves):
+    """
+    Merge classified tangents and curves into one list ordered by station.
+    
+    An object that classifies as both is listed once, as a tangent.
+    
+    Returns:
+        List of (element_type, object, properties) tuples sorted by
+        start station
+    """
+    elements = [('TANGENT', obj, obj.alignment_tangent) for obj in tangents]
+    tangent_set = set(tangents)
+    elements.extend(('CURVE', obj, obj.alignment_curve)
+                    for obj in curves if obj not in tangent_set)
+    elements.sort(key=lambda x: x[2].start_station)
+    return elements
+
+
+def _element_rows(elements):
+    """
+    Read the table fields of station-ordered elements.
+    
+    Each property is read once, and the angles (tangent bearings, curve
+    deflections) are converted to degrees in one vectorized call.
+    
+    Args:
+        elements: Output of _elements_by_station
+    
+    Returns:
+        List of (element_type, fields) pairs; fields holds every key used
+        by the row templates
+    """
+    rows = []
+    angles = np.empty(len(elements))
+    for i, (elem_type, obj, props) in enumerate(elements):
+        fields = {
+            'name': obj.name,
+            'start': props.start_station,
+            'end': props.end_station,
+            'length': props.length,
+            'constraint': props.constraint,
+        }
+        if elem_type == 'TANGENT':
+            angles[i] = props.bearing
+        else:
+            angles[i] = props.delta_angle
+            fields['radius'] = props.radius
+            fields['tangent'] = props.tangent_length
+        rows.append((elem_type, fields))
+    
+    for (elem_type, fields), degrees in zip(rows, np.degrees(angles)):
+        fields['bearing' if elem_type == 'TANGENT' else 'delta'] = degrees
+    return rows
+
+
+def _pi_name_key(obj):
+    """
+    Sort key for PI empties named PI_###.
+    
+    Orders by the integer suffix, so mixed zero-padding widths still sort
+    numerically; names without one follow in plain name order.
+    """
+    suffix = obj.name.rsplit('_', 1)[-1]
+    if suffix.isdigit():
+        return (0, int(suffix), obj.name)
+    return (1, 0, obj.name)
+
+
+def _parent_root(obj):
+    """
+    First alignment root among obj's ancestors, or None if there is none.
+    
+    The walk stops at the first named alignment root whose horizontal
+    layout collection holds obj, so an alignment parented under an
+    organizing empty still resolves to its own root. alignment_name has a
+    non-empty default on every object, hence the collection check.
+    """
+    root = obj.parent
+    while root is not None:
+        if hasattr(root, 'alignment_root') and root.alignment_root.alignment_name:
+            h_layout = bpy.data.collections.get(
+                f"{root.alignment_root.alignment_name}_Horizontal")
+            if h_layout is not None and obj.name in h_layout.objects:
+                return root
+        root = root.parent
+    return None
 
 
 class CIVIL_OT_create_alignment_separate(Operator):
@@ -44,10 +164,8 @@ class CIVIL_OT_create_alignment_separate(Operator):
     
     default_radius: FloatProperty(
         name="Default Curve Radius",
-        default=500.0,
-        min=10.0,
-        unit='LENGTH',
-        description="Default radius for curves at PIs"
+        description="Default radius for curves at PIs",
+        **CURVE_RADIUS_KWARGS
     )
     
     design_speed: FloatProperty(
@@ -69,15 +187,18 @@ class CIVIL_OT_create_alignment_separate(Operator):
             self.report({'ERROR'}, "Need at least 2 PI points (Empty objects named PI_*)")
             return {'CANCELLED'}
         
-        # Sort PIs by name
-        pis.sort(key=lambda x: x.name)
+        # Sort PIs by number
+        pis.sort(key=_pi_name_key)
         
-        print("\n" + "="*60)
-        print(f"Creating Professional Alignment: {self.alignment_name}")
-        print(f"  PIs: {len(pis)}")
-        print(f"  Default Radius: {self.default_radius}")
-        print(f"  Design Speed: {self.design_speed} mph")
-        print("="*60)
+        if preferences.is_debug():
+            sys.stdout.write("\n".join((
+                "\n" + "="*60,
+                f"Creating Professional Alignment: {self.alignment_name}",
+                f"  PIs: {len(pis)}",
+                f"  Default Radius: {self.default_radius}",
+                f"  Design Speed: {self.design_speed} mph",
+                "="*60,
+            )) + "\n")
         
         # Create alignment root
         alignment_root = align_obj.create_alignment_root(
@@ -86,6 +207,14 @@ class CIVIL_OT_create_alignment_separate(Operator):
             design_speed=self.design_speed
         )
         
+        # Resolve the horizontal layout collection once and track membership
+        # in name sets; `in` on collection.objects scans the whole collection
+        h_collection = align_obj.get_horizontal_collection(alignment_root)
+        scene_coll = context.scene.collection
+        if h_collection:
+            h_names = set(h_collection.objects.keys())
+            scene_names = set(scene_coll.objects.keys())
+        
         # Convert existing Empties to PI points with properties
         pi_objects = []
         for i, pi_empty in enumerate(pis):
@@ -105,16 +234,17 @@ class CIVIL_OT_create_alignment_separate(Operator):
             pi_objects.append(pi_empty)
             
             # Move to horizontal layout collection
-            h_layout_name = f"{alignment_root.name}_Horizontal"
-            if h_layout_name in bpy.data.collections:
-                collection = bpy.data.collections[h_layout_name]
-                if pi_empty.name not in collection.objects:
-                    collection.objects.link(pi_empty)
+            if h_collection:
+                if pi_empty.name not in h_names:
+                    h_collection.objects.link(pi_empty)
+                    h_names.add(pi_empty.name)
                 # Remove from scene collection if present
-                if pi_empty.name in context.scene.collection.objects:
-                    context.scene.collection.objects.unlink(pi_empty)
+                if pi_empty.name in scene_names:
+                    scene_coll.objects.unlink(pi_empty)
+                    scene_names.discard(pi_empty.name)
         
-        print(f"\nâœ“ Converted {len(pi_objects)} PIs to enhanced objects")
+        if preferences.is_debug():
+            print(f"\nâœ“ Converted {len(pi_objects)} PIs to enhanced objects")
         
         # Create tangent lines between consecutive PIs
         tangents = []
@@ -128,7 +258,8 @@ class CIVIL_OT_create_alignment_separate(Operator):
             )
             tangents.append(tangent)
         
-        print(f"âœ“ Created {len(tangents)} tangent lines")
+        if preferences.is_debug():
+            print(f"âœ“ Created {len(tangents)} tangent lines")
         
         # Create curves at intermediate PIs
         curves = []
@@ -158,7 +289,8 @@ class CIVIL_OT_create_alignment_separate(Operator):
                 tangents[i-1].alignment_tangent.next_element = curve
                 tangents[i].alignment_tangent.previous_element = curve
         
-        print(f"âœ“ Created {len(curves)} curves")
+        if preferences.is_debug():
+            print(f"âœ“ Created {len(curves)} curves")
         
         # Set up tangent-to-tangent relationships where no curve exists
         for i in range(len(tangents) - 1):
@@ -166,53 +298,49 @@ class CIVIL_OT_create_alignment_separate(Operator):
                 tangents[i].alignment_tangent.next_element = tangents[i+1]
                 tangents[i+1].alignment_tangent.previous_element = tangents[i]
         
-        # Calculate stations along alignment
-        align_obj.update_stations(alignment_root)
-        
-        # Print summary
-        print("\n" + "="*60)
-        print("ALIGNMENT CREATION SUMMARY")
-        print("="*60)
-        print(f"Name: {self.alignment_name}")
-        print(f"Total PIs: {len(pi_objects)}")
-        print(f"Tangent Segments: {len(tangents)}")
-        print(f"Curve Segments: {len(curves)}")
-        print(f"Total Length: {alignment_root.alignment_root.total_length:.2f}")
-        print(f"Auto-Update: {'ON' if alignment_root.alignment_root.auto_update_enabled else 'OFF'}")
-        print("="*60)
-        
-        # Report element details
-        total_length = alignment_root.alignment_root.total_length
-        
-        print("\nELEMENT DETAILS:")
-        print("-" * 60)
-        
-        # Get all elements sorted by station
-        h_layout_name = f"{alignment_root.name}_Horizontal"
-        if h_layout_name in bpy.data.collections:
-            collection = bpy.data.collections[h_layout_name]
-            
-            elements = []
-            for obj in collection.objects:
-                if hasattr(obj, 'alignment_tangent') and obj.alignment_tangent.object_type == 'ALIGNMENT_TANGENT':
-                    props = obj.alignment_tangent
-                    elements.append(('TANGENT', obj.name, props.start_station, props.end_station, props.length))
-                elif hasattr(obj, 'alignment_curve') and obj.alignment_curve.object_type == 'ALIGNMENT_CURVE':
-                    props = obj.alignment_curve
-                    elements.append(('CURVE', obj.name, props.start_station, props.end_station, props.length))
-            
-            elements.sort(key=lambda x: x[2])  # Sort by start station
-            
-            for elem_type, name, start_sta, end_sta, length in elements:
-                if elem_type == 'TANGENT':
-                    print(f"  {elem_type:8s} | {name:15s} | Sta {start_sta:7.2f} - {end_sta:7.2f} | L={length:7.2f}")
-                else:
-                    obj = bpy.data.objects[name]
-                    radius = obj.alignment_curve.radius
-                    delta = math.degrees(obj.alignment_curve.delta_angle)
-                    print(f"  {elem_type:8s} | {name:15s} | Sta {start_sta:7.2f} - {end_sta:7.2f} | L={length:7.2f} | R={radius:.1f} | Î”={delta:.1f}Â°")
+        # Calculate stations along alignment. Two PIs give a single tangent
+        # and no curves, so its stations are known without scanning and
+        # sorting the layout
+        if len(tangents) == 1 and not curves:
+            props = tangents[0].alignment_tangent
+            props.start_station = 0.0
+            props.end_station = props.length
+            alignment_root.alignment_root.total_length = props.length
+        else:
+            align_obj.update_stations(alignment_root)
         
-        print("=" * 60 + "\n")
+        if preferences.is_debug():
+            # Print summary, collected and written once instead of per line
+            lines = []
+            lines.append("\n" + "="*60)
+            lines.append("ALIGNMENT CREATION SUMMARY")
+            lines.append("="*60)
+            lines.append(f"Name: {self.alignment_name}")
+            lines.append(f"Total PIs: {len(pi_objects)}")
+            lines.append(f"Tangent Segments: {len(tangents)}")
+            lines.append(f"Curve Segments: {len(curves)}")
+            lines.append(f"Total Length: {alignment_root.alignment_root.total_length:.2f}")
+            lines.append(f"Auto-Update: {'ON' if alignment_root.alignment_root.auto_update_enabled else 'OFF'}")
+            lines.append("="*60)
+            
+            # Report element details
+            total_length = alignment_root.alignment_root.total_length
+            
+            lines.append("\nELEMENT DETAILS:")
+            lines.append("-" * 60)
+            
+            # Get all elements sorted by station
+            if h_collection:
+                layout_tangents, layout_curves = align_obj.get_alignment_elements(
+                    alignment_root, h_collection)
+            
+                elements = _elements_by_station(layout_tangents, layout_curves)
+                templates = {'TANGENT': _SUMMARY_TANGENT_ROW, 'CURVE': _SUMMARY_CURVE_ROW}
+                lines.extend(templates[elem_type].format(**fields)
+                             for elem_type, fields in _element_rows(elements))
+            
+            lines.append("=" * 60 + "\n")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         self.report({'INFO'}, f"Created alignment '{self.alignment_name}' with {len(tangents)} tangents and {len(curves)} curves")
         
@@ -235,51 +363,48 @@ class CIVIL_OT_update_alignment(Operator):
         """Execute the alignment update"""
         
         # Find all alignment roots in scene
-        alignment_roots = [obj for obj in context.scene.objects
-                          if obj.type == 'EMPTY' and hasattr(obj, 'alignment_root')
-                          and obj.alignment_root.object_type == 'ALIGNMENT_ROOT']
+        alignment_roots = align_obj.get_alignment_roots(context.scene)
         
         if not alignment_roots:
             self.report({'WARNING'}, "No alignments found in scene")
             return {'CANCELLED'}
         
-        print("\n" + "="*60)
-        print("UPDATING ALIGNMENTS")
-        print("="*60)
+        if preferences.is_debug():
+            print("\n" + "="*60)
+            print("UPDATING ALIGNMENTS")
+            print("="*60)
         
+        # Gather the elements of every alignment first, so the geometry of
+        # all tangents and all curves is recomputed in one batch each
+        # rather than one batch per alignment
+        updates = []
+        all_tangents, all_curves = [], []
         for alignment_root in alignment_roots:
-            print(f"\nUpdating: {alignment_root.name}")
-            
             # Get horizontal layout collection
-            h_layout_name = f"{alignment_root.name}_Horizontal"
-            if h_layout_name not in bpy.data.collections:
+            collection = align_obj.get_horizontal_collection(alignment_root)
+            if collection is None:
                 continue
             
-            collection = bpy.data.collections[h_layout_name]
-            
-            # Update all tangents
-            tangents = [obj for obj in collection.objects
-                       if hasattr(obj, 'alignment_tangent')
-                       and obj.alignment_tangent.object_type == 'ALIGNMENT_TANGENT']
-            
-            for tangent in tangents:
-                align_obj.update_tangent_geometry(tangent)
-            
-            # Update all curves
-            curves = [obj for obj in collection.objects
-                     if hasattr(obj, 'alignment_curve')
-                     and obj.alignment_curve.object_type == 'ALIGNMENT_CURVE']
-            
-            for curve in curves:
-                align_obj.update_curve_geometry(curve)
-            
+            tangents, curves = align_obj.get_alignment_elements(alignment_root, collection)
+            updates.append((alignment_root, len(tangents), len(curves)))
+            all_tangents.extend(tangents)
+            all_curves.extend(curves)
+        
+        align_obj.update_tangents_geometry(all_tangents)
+        align_obj.update_curves_geometry(all_curves)
+        
+        # Stations depend on the new element lengths, so they come last
+        for alignment_root, tangent_count, curve_count in updates:
             # Recalculate stations
             align_obj.update_stations(alignment_root)
             
-            print(f"  âœ“ Updated {len(tangents)} tangents and {len(curves)} curves")
-            print(f"  âœ“ New total length: {alignment_root.alignment_root.total_length:.2f}")
+            if preferences.is_debug():
+                print(f"\nUpdating: {alignment_root.name}")
+                print(f"  âœ“ Updated {tangent_count} tangents and {curve_count} curves")
+                print(f"  âœ“ New total length: {alignment_root.alignment_root.total_length:.2f}")
         
-        print("="*60 + "\n")
+        if preferences.is_debug():
+            print("="*60 + "\n")
         
         self.report({'INFO'}, f"Updated {len(alignment_roots)} alignment(s)")
         return {'FINISHED'}
@@ -290,7 +415,8 @@ class CIVIL_OT_analyze_alignment(Operator):
     Generate detailed analysis report for alignment.
     
     Prints comprehensive information about the alignment structure,
-    elements, and geometric properties.
+    elements, and geometric properties. Read-only: it never modifies the
+    scene, so it is registered without UNDO and pushes no undo step.
     """
     bl_idname = "civil.analyze_alignment"
     bl_label = "Analyze Alignment (v2)"
@@ -301,100 +427,68 @@ class CIVIL_OT_analyze_alignment(Operator):
         """Execute the alignment analysis"""
         
         # Find all alignment roots
-        alignment_roots = [obj for obj in context.scene.objects
-                          if obj.type == 'EMPTY' and hasattr(obj, 'alignment_root')
-                          and obj.alignment_root.object_type == 'ALIGNMENT_ROOT']
+        alignment_roots = align_obj.get_alignment_roots(context.scene)
         
         if not alignment_roots:
             self.report({'WARNING'}, "No alignments found in scene")
             return {'CANCELLED'}
         
+        # Collect the whole report and write it once instead of per line
+        lines = []
         for alignment_root in alignment_roots:
             props = alignment_root.alignment_root
             
-            print("\n" + "="*80)
-            print(f"ALIGNMENT ANALYSIS: {props.alignment_name}")
-            print("="*80)
+            lines.append("\n" + "="*80)
+            lines.append(f"ALIGNMENT ANALYSIS: {props.alignment_name}")
+            lines.append("="*80)
             
-            print(f"\nGENERAL PROPERTIES:")
-            print(f"  Type: {props.alignment_type}")
-            print(f"  Design Speed: {props.design_speed} mph")
-            print(f"  Total Length: {props.total_length:.2f}")
-            print(f"  Auto-Update: {'ENABLED' if props.auto_update_enabled else 'DISABLED'}")
+            lines.append(f"\nGENERAL PROPERTIES:")
+            lines.append(f"  Type: {props.alignment_type}")
+            lines.append(f"  Design Speed: {props.design_speed} mph")
+            lines.append(f"  Total Length: {props.total_length:.2f}")
+            lines.append(f"  Auto-Update: {'ENABLED' if props.auto_update_enabled else 'DISABLED'}")
             
             # Get horizontal layout
-            h_layout_name = f"{alignment_root.name}_Horizontal"
-            if h_layout_name not in bpy.data.collections:
-                print("\n  âš  No horizontal layout found")
+            collection = align_obj.get_horizontal_collection(alignment_root)
+            if collection is None:
+                lines.append("\n  âš  No horizontal layout found")
                 continue
             
-            collection = bpy.data.collections[h_layout_name]
-            
             # Count elements
             pis = [obj for obj in collection.objects
-                  if hasattr(obj, 'alignment_pi')
-                  and obj.alignment_pi.object_type == 'ALIGNMENT_PI']
+                   if obj.alignment_pi.object_type == 'ALIGNMENT_PI']
+            tangents, curves = align_obj.get_alignment_elements(alignment_root, collection)
             
-            tangents = [obj for obj in collection.objects
-                       if hasattr(obj, 'alignment_tangent')
-                       and obj.alignment_tangent.object_type == 'ALIGNMENT_TANGENT']
-            
-            curves = [obj for obj in collection.objects
-                     if hasattr(obj, 'alignment_curve')
-                     and obj.alignment_curve.object_type == 'ALIGNMENT_CURVE']
-            
-            print(f"\nELEMENT COUNT:")
-            print(f"  PIs: {len(pis)}")
-            print(f"  Tangents: {len(tangents)}")
-            print(f"  Curves: {len(curves)}")
-            print(f"  Total Elements: {len(tangents) + len(curves)}")
+            lines.append(f"\nELEMENT COUNT:")
+            lines.append(f"  PIs: {len(pis)}")
+            lines.append(f"  Tangents: {len(tangents)}")
+            lines.append(f"  Curves: {len(curves)}")
+            lines.append(f"  Total Elements: {len(tangents) + len(curves)}")
             
             # PI Details
-            print(f"\nPI DETAILS:")
-            print("-" * 80)
+            lines.append(f"\nPI DETAILS:")
+            lines.append("-" * 80)
             pis.sort(key=lambda x: x.alignment_pi.index)
             for pi in pis:
                 pi_props = pi.alignment_pi
                 loc = pi.location
-                print(f"  {pi.name:10s} | Index: {pi_props.index:2d} | "
-                      f"Location: ({loc.x:7.2f}, {loc.y:7.2f}, {loc.z:7.2f}) | "
-                      f"Radius: {pi_props.radius:6.1f}")
+                lines.append(_PI_ROW.format(
+                    name=pi.name, index=pi_props.index,
+                    x=loc.x, y=loc.y, z=loc.z, radius=pi_props.radius))
             
             # Element Details
-            print(f"\nELEMENT DETAILS:")
-            print("-" * 80)
-            
-            # Collect and sort all elements
-            elements = []
-            for obj in collection.objects:
-                if hasattr(obj, 'alignment_tangent') and obj.alignment_tangent.object_type == 'ALIGNMENT_TANGENT':
-                    props = obj.alignment_tangent
-                    elements.append(('TANGENT', obj, props.start_station))
-                elif hasattr(obj, 'alignment_curve') and obj.alignment_curve.object_type == 'ALIGNMENT_CURVE':
-                    props = obj.alignment_curve
-                    elements.append(('CURVE', obj, props.start_station))
+            lines.append(f"\nELEMENT DETAILS:")
+            lines.append("-" * 80)
             
-            elements.sort(key=lambda x: x[2])
+            # Reuse the classified lists rather than walking the layout again
+            elements = _elements_by_station(tangents, curves)
+            templates = {'TANGENT': _TANGENT_ROW, 'CURVE': _CURVE_ROW}
+            lines.extend(templates[elem_type].format(**fields)
+                         for elem_type, fields in _element_rows(elements))
             
-            for elem_type, obj, _ in elements:
-                if elem_type == 'TANGENT':
-                    props = obj.alignment_tangent
-                    print(f"  {elem_type:8s} | {obj.name:15s} | "
-                          f"Sta {props.start_station:8.2f} - {props.end_station:8.2f} | "
-                          f"Length: {props.length:8.2f} | "
-                          f"Bearing: {math.degrees(props.bearing):7.2f}Â° | "
-                          f"Constraint: {props.constraint}")
-                else:  # CURVE
-                    props = obj.alignment_curve
-                    print(f"  {elem_type:8s} | {obj.name:15s} | "
-                          f"Sta {props.start_station:8.2f} - {props.end_station:8.2f} | "
-                          f"Length: {props.length:8.2f} | "
-                          f"R={props.radius:6.1f} | "
-                          f"Î”={math.degrees(props.delta_angle):6.2f}Â° | "
-                          f"T={props.tangent_length:6.2f} | "
-                          f"Constraint: {props.constraint}")
-            
-            print("="*80 + "\n")
+            lines.append("="*80 + "\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         self.report({'INFO'}, f"Analyzed {len(alignment_roots)} alignment(s) - see console for details")
         return {'FINISHED'}
@@ -419,10 +513,8 @@ class CIVIL_OT_set_curve_radius(Operator):
     
     radius: FloatProperty(
         name="Radius",
-        default=500.0,
-        min=10.0,
-        unit='LENGTH',
-        description="New radius for the curve"
+        description="New radius for the curve",
+        **CURVE_RADIUS_KWARGS
     )
     
     @classmethod
@@ -469,7 +561,8 @@ class CIVIL_OT_set_curve_radius(Operator):
             align_obj.update_stations(alignment_root)
             
             self.report({'INFO'}, f"Curve radius set to {self.radius:.2f}")
-            print(f"Updated curve {obj.name} radius to {self.radius:.2f}")
+            if preferences.is_debug():
+                print(f"Updated curve {obj.name} radius to {self.radius:.2f}")
             
         except Exception as e:
             self.report({'ERROR'}, f"Failed to update curve: {str(e)}")
@@ -518,21 +611,19 @@ class CIVIL_OT_insert_pi(Operator):
     
     curve_radius: FloatProperty(
         name="Curve Radius",
-        default=500.0,
-        min=10.0,
-        unit='LENGTH',
-        description="Radius for curves at the new PI"
+        description="Radius for curves at the new PI",
+        **CURVE_RADIUS_KWARGS
     )
     
     @classmethod
     def poll(cls, context):
         """Only enable if exactly 2 PIs are selected"""
-        selected = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and 'PI_' in obj.name]
+        selected = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and obj.name.startswith('PI_')]
         return len(selected) == 2
     
     def invoke(self, context, event):
         """Set default location to midpoint between selected PIs"""
-        selected_pis = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and 'PI_' in obj.name]
+        selected_pis = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and obj.name.startswith('PI_')]
         if len(selected_pis) == 2:
             # Calculate midpoint
             mid = (selected_pis[0].location + selected_pis[1].location) / 2
@@ -545,8 +636,8 @@ class CIVIL_OT_insert_pi(Operator):
         """Insert new PI between selected PIs"""
         # Get selected PIs
         selected_pis = sorted(
-            [obj for obj in context.selected_objects if obj.type == 'EMPTY' and 'PI_' in obj.name],
-            key=lambda x: int(x.name.split('_')[1]) if '_' in x.name else 0
+            [obj for obj in context.selected_objects if obj.type == 'EMPTY' and obj.name.startswith('PI_')],
+            key=lambda x: x.alignment_pi.index
         )
         
         if len(selected_pis) != 2:
@@ -557,21 +648,23 @@ class CIVIL_OT_insert_pi(Operator):
         pi_after = selected_pis[1]
         
         # Verify they are consecutive
-        index_before = int(pi_before.name.split('_')[1])
-        index_after = int(pi_after.name.split('_')[1])
+        index_before = pi_before.alignment_pi.index
+        index_after = pi_after.alignment_pi.index
         
         if index_after != index_before + 1:
             self.report({'ERROR'}, "Selected PIs must be consecutive")
             return {'CANCELLED'}
         
-        # Find alignment root
-        alignment_root = None
-        for obj in bpy.data.objects:
-            if hasattr(obj, 'alignment_root') and obj.alignment_root.alignment_name:
-                # Check if this PI belongs to this alignment
-                if pi_before.parent == obj or self._find_alignment_for_pi(pi_before, obj):
-                    alignment_root = obj
-                    break
+        # Find alignment root: PIs are parented to it, so walk up the
+        # parents and only scan the scene if no ancestor is a root
+        alignment_root = _parent_root(pi_before)
+        if alignment_root is None:
+            for obj in bpy.data.objects:
+                if hasattr(obj, 'alignment_root') and obj.alignment_root.alignment_name:
+                    # Check if this PI belongs to this alignment
+                    if self._find_alignment_for_pi(pi_before, obj):
+                        alignment_root = obj
+                        break
         
         if not alignment_root:
             self.report({'ERROR'}, "Could not find alignment root")
@@ -598,89 +691,123 @@ class CIVIL_OT_insert_pi(Operator):
     def _find_alignment_for_pi(self, pi, alignment_root):
         """Check if PI belongs to this alignment"""
         align_name = alignment_root.alignment_root.alignment_name
-        h_layout_name = f"{align_name}_Horizontal"
-        if h_layout_name in bpy.data.collections:
-            h_layout = bpy.data.collections[h_layout_name]
+        h_layout = bpy.data.collections.get(f"{align_name}_Horizontal")
+        if h_layout is not None:
             return pi.name in h_layout.objects
         return False
     
     def _get_all_pis(self, alignment_root):
-        """Get all PI objects for this alignment, sorted by index"""
+        """
+        Get all PI objects for this alignment as (index, pi) pairs sorted
+        by index, so callers reuse the index read here
+        """
         align_name = alignment_root.alignment_root.alignment_name
-        h_layout_name = f"{align_name}_Horizontal"
-        
-        if h_layout_name not in bpy.data.collections:
+        h_layout = bpy.data.collections.get(f"{align_name}_Horizontal")
+        if h_layout is None:
             return []
         
-        h_layout = bpy.data.collections[h_layout_name]
-        pis = [obj for obj in h_layout.objects if obj.type == 'EMPTY' and 'PI_' in obj.name]
-        return sorted(pis, key=lambda x: int(x.name.split('_')[1]) if '_' in x.name else 0)
+        pis = [(obj.alignment_pi.index, obj) for obj in h_layout.objects
+               if obj.type == 'EMPTY' and obj.name.startswith('PI_')]
+        return sorted(pis, key=itemgetter(0))
     
     def _insert_pi_in_alignment(self, alignment_root, all_pis, insert_after_index, location, radius):
         """Insert new PI and rebuild alignment"""
-        align_name = alignment_root.alignment_root.alignment_name
-        h_layout_name = f"{align_name}_Horizontal"
-        h_layout = bpy.data.collections[h_layout_name]
-        
-        # Step 1: Create the new PI object
+        pis_by_index = dict(all_pis)
         new_index = insert_after_index + 1
-        new_pi_name = f"PI_{new_index:03d}"
+        
+        # Step 1: Find the tangent between the two original PIs. It is the
+        # outgoing tangent of the first one, so follow the PI's pointer
+        # instead of scanning the layout collection
+        tangent_to_delete = None
+        pi_start = pis_by_index.get(insert_after_index)
+        pi_end = pis_by_index.get(insert_after_index + 1)
+        if pi_start and pi_end:
+            tangent = pi_start.alignment_pi.tangent_out
+            if tangent and tangent.alignment_tangent.pi_end == pi_end:
+                tangent_to_delete = tangent
+        
+        # Step 2: Find curves adjacent to that tangent, i.e. the curves at
+        # its two end PIs
+        curves_to_delete = []
+        if tangent_to_delete:
+            props = tangent_to_delete.alignment_tangent
+            for pi in (props.pi_start, props.pi_end):
+                if pi and pi.alignment_pi.curve:
+                    curves_to_delete.append(pi.alignment_pi.curve)
+        
+        # Delete old elements in a single batch
+        old_elements = list(curves_to_delete)
+        if tangent_to_delete:
+            old_elements.append(tangent_to_delete)
+        bpy.data.batch_remove(ids=old_elements)
+        
+        # Step 3: Renumber the PIs after the insertion point together with
+        # the tangent leaving each one and its curve, keeping the
+        # Tangent_<start PI> / Curve_<PI - 1> naming. Go from the last PI
+        # down so every new name is already free when it is assigned
+        for current_index, pi in reversed(all_pis):
+            if current_index <= insert_after_index:
+                break
+            shifted = current_index + 1
+            pi_props = pi.alignment_pi
+            pi.name = f"PI_{shifted:03d}"
+            pi_props.index = shifted
+            if pi_props.tangent_out:
+                pi_props.tangent_out.name = f"Tangent_{shifted:03d}"
+            if pi_props.curve:
+                pi_props.curve.name = f"Curve_{shifted - 1:03d}"
+        
+        # Step 4: Create the new PI; create_pi_point parents it to the root
+        # and links it into the horizontal layout collection
         new_pi = align_obj.create_pi_point(
-            new_pi_name,
+            f"PI_{new_index:03d}",
             location,
             new_index,
             alignment_root,
             radius=radius
         )
         
-        # Link to collection
-        h_layout.objects.link(new_pi)
-        new_pi.parent = alignment_root
-        
-        # Step 2: Renumber all PIs after the insertion point
-        for pi in all_pis:
-            current_index = int(pi.name.split('_')[1])
-            if current_index > insert_after_index:
-                new_name = f"PI_{current_index + 1:03d}"
-                pi.name = new_name
-                if hasattr(pi, 'alignment_pi'):
-                    pi.alignment_pi.pi_index = current_index + 1
-        
-        # Step 3: Find and delete the tangent between the two original PIs
-        tangent_to_delete = None
-        for obj in h_layout.objects:
-            if 'Tangent_' in obj.name and hasattr(obj, 'alignment_tangent'):
-                props = obj.alignment_tangent
-                pi_start = props.pi_start
-                pi_end = props.pi_end
-                if pi_start and pi_end:
-                    start_idx = int(pi_start.name.split('_')[1]) if '_' in pi_start.name else 0
-                    end_idx = int(pi_end.name.split('_')[1]) if '_' in pi_end.name else 0
-                    # Adjust for renumbering
-                    if start_idx == insert_after_index and end_idx == insert_after_index + 2:
-                        tangent_to_delete = obj
-                        break
-        
-        # Step 4: Find and delete curves adjacent to the deleted tangent
-        curves_to_delete = []
-        if tangent_to_delete:
-            for obj in h_layout.objects:
-                if 'Curve_' in obj.name and hasattr(obj, 'alignment_curve'):
-                    props = obj.alignment_curve
-                    if props.tangent_before == tangent_to_delete or props.tangent_after == tangent_to_delete:
-                        curves_to_delete.append(obj)
-        
-        # Delete old elements
-        if tangent_to_delete:
-            bpy.data.objects.remove(tangent_to_delete, do_unlink=True)
-        for curve in curves_to_delete:
-            bpy.data.objects.remove(curve, do_unlink=True)
+        # Step 5: Rebuild only around the new PI. The two new tangents and
+        # the curves at the new PI and its two neighbours are the only
+        # elements that change, so there is no need to regenerate every
+        # alignment in the scene
+        ordered = [pi for _, pi in all_pis]
+        k = sum(1 for index, _ in all_pis if index <= insert_after_index)
+        ordered.insert(k, new_pi)
+        pi_prev, pi_next = ordered[k - 1], ordered[k + 1]
+        
+        align_obj.create_tangent_line(
+            f"Tangent_{pi_prev.alignment_pi.index:03d}", pi_prev, new_pi, alignment_root)
+        align_obj.create_tangent_line(
+            f"Tangent_{new_index:03d}", new_pi, pi_next, alignment_root)
+        
+        for i in range(max(k - 1, 1), min(k + 2, len(ordered) - 1)):
+            pi = ordered[i]
+            curve = align_obj.create_curve(
+                name=f"Curve_{pi.alignment_pi.index - 1:03d}",
+                pi=pi,
+                pi_prev=ordered[i - 1],
+                pi_next=ordered[i + 1],
+                radius=pi.alignment_pi.radius,
+                alignment_root=alignment_root,
+                sample_interval=5.0
+            )
+            
+            # Link the curve between its tangents
+            pi_props = pi.alignment_pi
+            if curve:
+                curve.alignment_curve.previous_element = pi_props.tangent_in
+                curve.alignment_curve.next_element = pi_props.tangent_out
+                pi_props.tangent_in.alignment_tangent.next_element = curve
+                pi_props.tangent_out.alignment_tangent.previous_element = curve
+            else:
+                pi_props.tangent_in.alignment_tangent.next_element = pi_props.tangent_out
+                pi_props.tangent_out.alignment_tangent.previous_element = pi_props.tangent_in
         
-        # Step 5: Rebuild alignment with new PI
-        # We'll use the update operator to regenerate everything
-        bpy.ops.civil.update_alignment()
+        align_obj.update_stations(alignment_root)
         
-        print(f"Inserted PI at index {new_index}")
+        if preferences.is_debug():
+            print(f"Inserted PI at index {new_index}")
 
 
 class CIVIL_OT_delete_pi(Operator):
@@ -703,28 +830,30 @@ class CIVIL_OT_delete_pi(Operator):
     @classmethod
     def poll(cls, context):
         """Only enable if exactly 1 PI is selected"""
-        selected = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and 'PI_' in obj.name]
+        selected = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and obj.name.startswith('PI_')]
         return len(selected) == 1
     
     def execute(self, context):
         """Delete selected PI"""
         # Get selected PI
-        selected_pis = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and 'PI_' in obj.name]
+        selected_pis = [obj for obj in context.selected_objects if obj.type == 'EMPTY' and obj.name.startswith('PI_')]
         
         if len(selected_pis) != 1:
             self.report({'ERROR'}, "Must select exactly 1 PI")
             return {'CANCELLED'}
         
         pi_to_delete = selected_pis[0]
-        pi_index = int(pi_to_delete.name.split('_')[1])
-        
-        # Find alignment root
-        alignment_root = None
-        for obj in bpy.data.objects:
-            if hasattr(obj, 'alignment_root') and obj.alignment_root.alignment_name:
-                if pi_to_delete.parent == obj or self._find_alignment_for_pi(pi_to_delete, obj):
-                    alignment_root = obj
-                    break
+        pi_index = pi_to_delete.alignment_pi.index
+        
+        # Find alignment root: PIs are parented to it, so walk up the
+        # parents and only scan the scene if no ancestor is a root
+        alignment_root = _parent_root(pi_to_delete)
+        if alignment_root is None:
+            for obj in bpy.data.objects:
+                if hasattr(obj, 'alignment_root') and obj.alignment_root.alignment_name:
+                    if self._find_alignment_for_pi(pi_to_delete, obj):
+                        alignment_root = obj
+                        break
         
         if not alignment_root:
             self.report({'ERROR'}, "Could not find alignment root")
@@ -747,23 +876,24 @@ class CIVIL_OT_delete_pi(Operator):
     def _find_alignment_for_pi(self, pi, alignment_root):
         """Check if PI belongs to this alignment"""
         align_name = alignment_root.alignment_root.alignment_name
-        h_layout_name = f"{align_name}_Horizontal"
-        if h_layout_name in bpy.data.collections:
-            h_layout = bpy.data.collections[h_layout_name]
+        h_layout = bpy.data.collections.get(f"{align_name}_Horizontal")
+        if h_layout is not None:
             return pi.name in h_layout.objects
         return False
     
     def _get_all_pis(self, alignment_root):
-        """Get all PI objects for this alignment, sorted by index"""
+        """
+        Get all PI objects for this alignment as (index, pi) pairs sorted
+        by index, so callers reuse the index read here
+        """
         align_name = alignment_root.alignment_root.alignment_name
-        h_layout_name = f"{align_name}_Horizontal"
-        
-        if h_layout_name not in bpy.data.collections:
+        h_layout = bpy.data.collections.get(f"{align_name}_Horizontal")
+        if h_layout is None:
             return []
         
-        h_layout = bpy.data.collections[h_layout_name]
-        pis = [obj for obj in h_layout.objects if obj.type == 'EMPTY' and 'PI_' in obj.name]
-        return sorted(pis, key=lambda x: int(x.name.split('_')[1]) if '_' in x.name else 0)
+        pis = [(obj.alignment_pi.index, obj) for obj in h_layout.objects
+               if obj.type == 'EMPTY' and obj.name.startswith('PI_')]
+        return sorted(pis, key=itemgetter(0))
     
     def _delete_pi_from_alignment(self, alignment_root, all_pis, pi_to_delete, pi_index):
         """Delete PI and rebuild alignment"""
@@ -771,49 +901,39 @@ class CIVIL_OT_delete_pi(Operator):
         h_layout_name = f"{align_name}_Horizontal"
         h_layout = bpy.data.collections[h_layout_name]
         
-        # Step 1: Find tangents connected to this PI
-        tangents_to_delete = []
-        for obj in h_layout.objects:
-            if 'Tangent_' in obj.name and hasattr(obj, 'alignment_tangent'):
-                props = obj.alignment_tangent
-                pi_start = props.pi_start
-                pi_end = props.pi_end
-                if pi_start == pi_to_delete or pi_end == pi_to_delete:
-                    tangents_to_delete.append(obj)
-        
-        # Step 2: Find curves connected to those tangents
-        curves_to_delete = []
-        for tangent in tangents_to_delete:
-            for obj in h_layout.objects:
-                if 'Curve_' in obj.name and hasattr(obj, 'alignment_curve'):
-                    props = obj.alignment_curve
-                    if props.tangent_before == tangent or props.tangent_after == tangent:
-                        curves_to_delete.append(obj)
-        
-        # Step 3: Delete the PI and its connected elements
-        bpy.data.objects.remove(pi_to_delete, do_unlink=True)
-        
-        for tangent in tangents_to_delete:
-            bpy.data.objects.remove(tangent, do_unlink=True)
-        
-        for curve in curves_to_delete:
-            bpy.data.objects.remove(curve, do_unlink=True)
+        # Step 1: Find tangents connected to this PI through its pointers
+        pi_props = pi_to_delete.alignment_pi
+        tangents_to_delete = [t for t in (pi_props.tangent_in, pi_props.tangent_out) if t]
+        
+        # Step 2: Find curves connected to those tangents, i.e. the curves
+        # at each tangent's end PIs. Both tangents share the deleted PI, so
+        # its curve is reached twice; the set removes it only once
+        curves_to_delete = {
+            pi.alignment_pi.curve
+            for tangent in tangents_to_delete
+            for pi in (tangent.alignment_tangent.pi_start, tangent.alignment_tangent.pi_end)
+            if pi and pi.alignment_pi.curve
+        }
+        
+        # Step 3: Delete the PI and its connected elements in one batch
+        bpy.data.batch_remove(ids=[pi_to_delete, *tangents_to_delete, *curves_to_delete])
+        
+        # Step 4: Rebuild alignment. Only the relative order of the PI
+        # indices matters here, so the gap left by the deleted PI is fine
+        bpy.ops.civil.update_alignment()
         
-        # Step 4: Renumber all PIs after the deleted one
-        for pi in all_pis:
-            if pi == pi_to_delete:
-                continue
-            current_index = int(pi.name.split('_')[1])
+        # Step 5: Renumber the PIs after the deleted one. The deleted PI
+        # held pi_index itself, so the comparison also skips it without
+        # touching its removed data-block, and only PIs whose index
+        # actually changes are written
+        for current_index, pi in all_pis:
             if current_index > pi_index:
-                new_name = f"PI_{current_index - 1:03d}"
-                pi.name = new_name
-                if hasattr(pi, 'alignment_pi'):
-                    pi.alignment_pi.pi_index = current_index - 1
-        
-        # Step 5: Rebuild alignment
-        bpy.ops.civil.update_alignment()
+                new_index = current_index - 1
+                pi.name = f"PI_{new_index:03d}"
+                pi.alignment_pi.index = new_index
         
-        print(f"Deleted PI_{pi_index:03d}")
+        if preferences.is_debug():
+            print(f"Deleted PI_{pi_index:03d}")
 
 
 # Registration
@@ -10,9 +10,8 @@ Operators for creating and managing horizontal roadway alignments:
 """
 
 import bpy
-import math
 import json
-from mathutils import Vector
+import numpy as np
 from bpy.types import Operator
 from bpy.props import StringProperty
 
@@ -40,8 +39,152 @@ def get_pi_objects():
     if not pi_col:
         return []
     
+    # Hand-tagged PIs and PIs from older files may lack pi_number
     pi_objects = [obj for obj in pi_col.objects if "is_pi" in obj]
-    return sorted(pi_objects, key=lambda x: x.get("pi_number", 0))
+    return sorted(pi_objects, key=lambda obj: obj.get("pi_number", 0))
+
+def count_pi_candidates():
+    """Upper bound on the PI count, read without filtering or sorting"""
+    pi_col = bpy.data.collections.get("PI_Points")
+    return len(pi_col.objects) if pi_col else 0
+
+def get_pi_locations(pi_objects):
+    """Get PI locations as an (N, 3) array, in the order of pi_objects
+    
+    Reads every location in the PI collection with a single foreach_get
+    call instead of crossing into RNA three times per PI. Locations are
+    float32, so the buffer is too; the result is returned as float64.
+    """
+    members = bpy.data.collections["PI_Points"].objects
+    buf = np.empty(len(members) * 3, dtype=np.float32)
+    members.foreach_get("location", buf)
+    
+    rows = {name: i for i, name in enumerate(members.keys())}
+    return buf.reshape(-1, 3)[[rows[pi.name] for pi in pi_objects]].astype(np.float64)
+
+def set_spline_points(spline, points):
+    """Write (N, 3) points into a spline's existing points with one foreach_set
+    
+    Spline points hold homogeneous (x, y, z, w) coordinates, so w is set to 1.
+    """
+    coords = np.ones((len(spline.points), 4), dtype=np.float32)
+    coords[:, :3] = points
+    spline.points.foreach_set("co", coords.ravel())
+
+def compute_curve_data(locs, radius):
+    """
+    Compute curve geometry at every interior PI in one vectorized pass.
+    
+    Args:
+        locs: (N, 3) array of PI locations in alignment order
+        radius: Curve radius applied at every PI
+    
+    Returns:
+        Dict with the per-segment lengths (length N-1) and per-curve arrays
+        (length N-2): unit back/forward tangents, z component of their
+        cross product (turn direction), deflection angle, a mask of PIs
+        that actually deflect, tangent length, curve length, and the PC,
+        PT and curve center points
+    """
+    # One pass over the segment vectors gives squared lengths; the single
+    # sqrt is shared by the segment lengths and the tangent normalization
+    diffs = np.diff(locs, axis=0)
+    segment_length = np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
+    tangents = diffs / segment_length[:, None]
+    back, forward = tangents[:-1], tangents[1:]
+    
+    # For unit tangents |b x f| = sin(delta) and b . f = cos(delta), so the
+    # half-angle identity tan(delta/2) = sin(delta) / (1 + cos(delta)) gives
+    # the tangent length without another transcendental call
+    cross = np.cross(back, forward)
+    sin_delta = np.sqrt(np.einsum('ij,ij->i', cross, cross))
+    cos_delta = np.einsum('ij,ij->i', back, forward)
+    delta = np.arctan2(sin_delta, cos_delta)
+    
+    # Collinear PIs get zero-length curves through a mask rather than a
+    # per-curve branch
+    curved = delta > 1e-12
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tangent_length = np.where(curved, radius * sin_delta / (1.0 + cos_delta), 0.0)
+    
+    # PC and PT sit a tangent length back and ahead of each PI; the center
+    # is a radius off the PC, perpendicular to the back tangent on the
+    # inside of the turn
+    pis = locs[1:-1]
+    pc = pis - back * tangent_length[:, None]
+    pt = pis + forward * tangent_length[:, None]
+    perpendicular = np.zeros_like(back)
+    perpendicular[:, 0] = -back[:, 1]
+    perpendicular[:, 1] = back[:, 0]
+    perpendicular[cross[:, 2] < 0] *= -1.0
+    center = pc + perpendicular * radius
+    
+    return {
+        'segment_length': segment_length,
+        'back': back,
+        'forward': forward,
+        'turn': cross[:, 2],
+        'delta': delta,
+        'curved': curved,
+        'tangent_length': tangent_length,
+        'curve_length': np.where(curved, radius * delta, 0.0),
+        'pc': pc,
+        'pt': pt,
+        'center': center,
+    }
+
+def sample_arc(pc, center, delta, num_points):
+    """
+    Sample the interior points of a circular arc.
+    
+    Rotates the PC about the center by every sample angle at once; the
+    endpoints (PC and PT) are not included.
+    
+    Args:
+        pc: (3,) point of curvature
+        center: (3,) curve center
+        delta: Deflection angle in radians
+        num_points: Number of arc divisions
+    
+    Returns:
+        (num_points - 1, 3) array of arc points
+    """
+    angles = delta * np.arange(1, num_points) / num_points
+    cos_a = np.cos(angles)
+    sin_a = np.sin(angles)
+    
+    dx, dy = pc[0] - center[0], pc[1] - center[1]
+    return np.column_stack((
+        center[0] + dx * cos_a - dy * sin_a,
+        center[1] + dx * sin_a + dy * cos_a,
+        np.full_like(angles, pc[2]),
+    ))
+
+# Last computed curve data, keyed on the PI layout and radius it came from,
+# so tangent and curve operators run back to back share one computation
+_curve_data_cache = {}
+
+def get_curve_data(pi_objects, radius):
+    """Get curve data for pi_objects, reusing the cached result if the PI
+    names, locations and radius are unchanged
+    
+    The returned dict is that of compute_curve_data with the PI locations
+    added under 'locs'.
+    """
+    locs = get_pi_locations(pi_objects)
+    key = (tuple(pi.name for pi in pi_objects), locs.tobytes(), radius)
+    
+    data = _curve_data_cache.get(key)
+    if data is None:
+        data = compute_curve_data(locs, radius)
+        data['locs'] = locs
+        _curve_data_cache.clear()
+        _curve_data_cache[key] = data
+    return data
+
+def invalidate_curve_data():
+    """Drop cached curve data after PIs are added or removed"""
+    _curve_data_cache.clear()
 
 # ============================================================================
 # PI POINT OPERATORS
@@ -65,23 +208,27 @@ class CIVIL_OT_AddPI(Operator):
         # Count existing PIs
         pi_count = len([obj for obj in pi_col.objects if obj.name.startswith("PI_")])
         
-        # Create PI empty
+        # Create PI empty directly in the PI collection
         pi_name = f"PI_{pi_count + 1:03d}"
-        bpy.ops.object.empty_add(type='SPHERE', location=cursor_loc)
-        pi_obj = context.active_object
-        pi_obj.name = pi_name
+        pi_obj = bpy.data.objects.new(pi_name, None)
+        pi_obj.empty_display_type = 'SPHERE'
         pi_obj.empty_display_size = props.pi_size
-        
-        # Move to PI collection
-        for col in pi_obj.users_collection:
-            col.objects.unlink(pi_obj)
+        pi_obj.location = cursor_loc
         pi_col.objects.link(pi_obj)
         
+        # Select it as the active object, as empty_add would
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        pi_obj.select_set(True)
+        context.view_layer.objects.active = pi_obj
+        
         # Store custom properties
         pi_obj["is_pi"] = True
         pi_obj["pi_number"] = pi_count + 1
         pi_obj["station"] = 0.0
         
+        invalidate_curve_data()
+        
         # Mark as IFC Referent if Bonsai is available
         try:
             pi_obj.civil_ifc.ifc_class = 'IFCREFERENT'
@@ -104,12 +251,20 @@ class CIVIL_OT_CreateTangents(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
+        # Reject before building the sorted PI list when it cannot pass
+        if count_pi_candidates() < 2:
+            self.report({'WARNING'}, "Need at least 2 PI points")
+            return {'CANCELLED'}
+        
         pi_objects = get_pi_objects()
         
         if len(pi_objects) < 2:
             self.report({'WARNING'}, "Need at least 2 PI points")
             return {'CANCELLED'}
         
+        curves = get_curve_data(pi_objects, context.scene.civil_alignment.curve_radius)
+        locs = curves['locs']
+        
         # Create curve for tangents
         curve_data = bpy.data.curves.new(name="Alignment_Tangents", type='CURVE')
         curve_data.dimensions = '3D'
@@ -118,9 +273,7 @@ class CIVIL_OT_CreateTangents(Operator):
         # Create polyline
         polyline = curve_data.splines.new('POLY')
         polyline.points.add(len(pi_objects) - 1)
-        
-        for i, pi_obj in enumerate(pi_objects):
-            polyline.points[i].co = (*pi_obj.location, 1.0)
+        set_spline_points(polyline, locs)
         
         # Create object
         curve_obj = bpy.data.objects.new("Alignment_Tangents", curve_data)
@@ -134,14 +287,11 @@ class CIVIL_OT_CreateTangents(Operator):
         except:
             pass
         
-        # Calculate stations
-        cumulative_length = 0.0
-        pi_objects[0]["station"] = 0.0
+        # Calculate stations, starting from 0.0 at the first PI
+        stations = np.concatenate(([0.0], np.cumsum(curves['segment_length'])))
         
-        for i in range(1, len(pi_objects)):
-            segment_length = (pi_objects[i].location - pi_objects[i-1].location).length
-            cumulative_length += segment_length
-            pi_objects[i]["station"] = cumulative_length
+        for pi_obj, station in zip(pi_objects, stations.tolist()):
+            pi_obj["station"] = station
         
         self.report({'INFO'}, f"Created tangent alignment through {len(pi_objects)} PIs")
         return {'FINISHED'}
@@ -161,6 +311,11 @@ class CIVIL_OT_InsertCurves(Operator):
         props = context.scene.civil_alignment
         radius = props.curve_radius
         
+        # Reject before building the sorted PI list when it cannot pass
+        if count_pi_candidates() < 3:
+            self.report({'WARNING'}, "Need at least 3 PIs to insert curves")
+            return {'CANCELLED'}
+        
         pi_objects = get_pi_objects()
         
         if len(pi_objects) < 3:
@@ -175,74 +330,54 @@ class CIVIL_OT_InsertCurves(Operator):
         spline = curve_data.splines.new('NURBS')
         all_points = []
         
+        curves = get_curve_data(pi_objects, radius)
+        locs = curves['locs']
+        
+        # Bind the per-PI arrays to locals once instead of looking them up
+        # in the dict on every iteration
+        curved = curves['curved'].tolist()
+        deltas = curves['delta']
+        tangent_lengths = curves['tangent_length'].tolist()
+        curve_lengths = curves['curve_length'].tolist()
+        pcs, pts, centers = curves['pc'], curves['pt'], curves['center']
+        num_points = np.maximum(10, (np.degrees(deltas) / 5).astype(int)).tolist()
+        
         # Add first PI
-        all_points.append(pi_objects[0].location)
+        all_points.append(locs[0])
         
         # Process middle PIs with curves
         for i in range(1, len(pi_objects) - 1):
-            pi_prev = pi_objects[i - 1]
             pi_curr = pi_objects[i]
-            pi_next = pi_objects[i + 1]
-            
-            # Calculate tangent vectors
-            back_tan = (pi_curr.location - pi_prev.location).normalized()
-            forward_tan = (pi_next.location - pi_curr.location).normalized()
             
-            # Calculate deflection angle
-            dot_product = max(-1.0, min(1.0, back_tan.dot(forward_tan)))
-            delta = math.acos(dot_product)
+            # A PI on a straight line has no arc to sample, and must not
+            # keep curve data stored while it was still curved
+            if not curved[i - 1]:
+                all_points.append(locs[i])
+                for key in ("curve_radius", "curve_length", "tangent_length"):
+                    if key in pi_curr:
+                        del pi_curr[key]
+                continue
             
-            # Calculate tangent length
-            tangent_length = radius * math.tan(delta / 2)
-            
-            # Calculate PC and PT
-            pc = pi_curr.location - back_tan * tangent_length
-            pt = pi_curr.location + forward_tan * tangent_length
+            pc = pcs[i - 1]
             
             all_points.append(pc)
             
-            # Calculate curve center
-            pc_to_pi = (pi_curr.location - pc).normalized()
-            perpendicular = Vector((-pc_to_pi.y, pc_to_pi.x, 0.0))
-            
-            cross = back_tan.cross(forward_tan)
-            if cross.z < 0:
-                perpendicular = -perpendicular
-            
-            center = pc + perpendicular * radius
-            
             # Generate arc points
-            num_curve_points = max(10, int(math.degrees(delta) / 5))
-            for j in range(1, num_curve_points):
-                t = j / num_curve_points
-                angle = delta * t
-                
-                pc_vec = pc - center
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
-                
-                rotated = Vector((
-                    pc_vec.x * cos_a - pc_vec.y * sin_a,
-                    pc_vec.x * sin_a + pc_vec.y * cos_a,
-                    pc_vec.z
-                ))
-                
-                all_points.append(center + rotated)
+            all_points.extend(sample_arc(pc, centers[i - 1], deltas[i - 1], num_points[i - 1]))
             
-            all_points.append(pt)
+            all_points.append(pts[i - 1])
             
             # Store curve data on PI
             pi_curr["curve_radius"] = radius
-            pi_curr["curve_length"] = radius * delta
-            pi_curr["tangent_length"] = tangent_length
+            pi_curr["curve_length"] = curve_lengths[i - 1]
+            pi_curr["tangent_length"] = tangent_lengths[i - 1]
         
         # Add last PI
-        all_points.append(pi_objects[-1].location)
+        all_points.append(locs[-1])
         
         # Apply points to spline
         spline.points.add(len(all_points) - 1)
-        for i, pt in enumerate(all_points):
-            spline.points[i].co = (*pt, 1.0)
+        set_spline_points(spline, all_points)
         
         # Create object
         curve_obj = bpy.data.objects.new("Alignment_WithCurves", curve_data)
@@ -297,50 +432,58 @@ class CIVIL_OT_AddStations(Operator):
         
         spline = curve.splines[0]
         
-        # Calculate total length
-        total_length = 0.0
-        for i in range(len(spline.points) - 1):
-            p1 = Vector(spline.points[i].co[:3])
-            p2 = Vector(spline.points[i + 1].co[:3])
-            total_length += (p2 - p1).length
+        # Cumulative length at every spline point, computed once so each
+        # station is located by binary search instead of a segment walk
+        n = len(spline.points)
+        buf = np.empty(n * 4, dtype=np.float32)
+        spline.points.foreach_get("co", buf)
+        pts = buf.reshape(n, 4)[:, :3].astype(np.float64)
+        segment_lengths = np.linalg.norm(np.diff(pts, axis=0), axis=1)
+        cumulative = np.concatenate(([0.0], np.cumsum(segment_lengths)))
+        total_length = cumulative[-1]
+        
+        # Place every station at once: find the first segment whose end
+        # reaches each station and interpolate along it
+        stations = np.arange(int(total_length // interval) + 1) * interval
+        seg = np.searchsorted(cumulative[1:], stations)
+        valid = seg < len(segment_lengths)
+        stations, seg = stations[valid], seg[valid]
+        
+        seg_len = segment_lengths[seg]
+        t = np.divide(stations - cumulative[seg], seg_len,
+                      out=np.zeros_like(stations), where=seg_len > 0)
+        positions = pts[seg] + t[:, None] * (pts[seg + 1] - pts[seg])
+        
+        # Build all labels first, then create every data-block, then link
+        # them, so no RNA writes are interleaved with the geometry pass and
+        # the scene only changes in one final step
+        labels = [f"{int(station/100):d}+{int(station%100):02d}"
+                  for station in stations.tolist()]
+        
+        # Each label needs its own FONT curve for its body text, but the
+        # font settings are set once on the first and carried over by copy()
+        text_objs = []
+        font_template = None
+        for station_text, pos in zip(labels, positions):
+            if font_template is None:
+                text_data = bpy.data.curves.new(name=station_text, type='FONT')
+                text_data.size = 5.0
+                text_data.extrude = 0.1
+                font_template = text_data
+            else:
+                text_data = font_template.copy()
+                text_data.name = station_text
+            text_data.body = station_text
+            
+            text_obj = bpy.data.objects.new(f"STA_{station_text}", text_data)
+            text_obj.location = pos
+            text_objs.append(text_obj)
         
-        # Place stations
-        station = 0.0
-        station_count = 0
+        link = stations_col.objects.link
+        for text_obj in text_objs:
+            link(text_obj)
         
-        while station <= total_length:
-            target_length = station
-            cumulative = 0.0
-            
-            for i in range(len(spline.points) - 1):
-                p1 = Vector(spline.points[i].co[:3])
-                p2 = Vector(spline.points[i + 1].co[:3])
-                segment_length = (p2 - p1).length
-                
-                if cumulative + segment_length >= target_length:
-                    t = (target_length - cumulative) / segment_length if segment_length > 0 else 0
-                    pos = p1.lerp(p2, t)
-                    
-                    # Create text object
-                    station_text = f"{int(station/100):d}+{int(station%100):02d}"
-                    bpy.ops.object.text_add(location=pos)
-                    text_obj = context.active_object
-                    text_obj.name = f"STA_{station_text}"
-                    text_obj.data.body = station_text
-                    text_obj.data.size = 5.0
-                    text_obj.data.extrude = 0.1
-                    
-                    # Move to stations collection
-                    for col in text_obj.users_collection:
-                        col.objects.unlink(text_obj)
-                    stations_col.objects.link(text_obj)
-                    
-                    station_count += 1
-                    break
-                
-                cumulative += segment_length
-            
-            station += interval
+        station_count = len(text_objs)
         
         self.report({'INFO'}, f"Added {station_count} station markers")
         return {'FINISHED'}
@@ -358,13 +501,16 @@ class CIVIL_OT_ClearAlignment(Operator):
     
     def execute(self, context):
         collections_to_clear = ["Alignment", "PI_Points", "Stations"]
+        cols = [col for col in map(bpy.data.collections.get, collections_to_clear)
+                if col]
+        
+        # Remove the objects, then the emptied collections, in one
+        # batch each instead of one removal per object
+        victims = {obj for col in cols for obj in col.objects}
+        bpy.data.batch_remove(ids=victims)
+        bpy.data.batch_remove(ids=cols)
         
-        for col_name in collections_to_clear:
-            col = bpy.data.collections.get(col_name)
-            if col:
-                for obj in list(col.objects):
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                bpy.data.collections.remove(col)
+        invalidate_curve_data()
         
         self.report({'INFO'}, "Alignment cleared")
         return {'FINISHED'}
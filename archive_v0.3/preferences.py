@@ -13,6 +13,21 @@ from bpy.props import StringProperty, BoolProperty, FloatProperty, EnumProperty
 from bpy.types import AddonPreferences
 
 
+# debug_mode mirrored at module level, so hot paths can test it without
+# looking up the addon preferences on every print
+_debug = False
+
+
+def _debug_mode_update(self, context):
+    global _debug
+    _debug = self.debug_mode
+
+
+def is_debug():
+    """Whether verbose console output is enabled (the debug_mode preference)"""
+    return _debug
+
+
 class BlenderCivilPreferences(AddonPreferences):
     """Preferences for BlenderCivil addon"""
     bl_idname = "BlenderCivil"
@@ -191,6 +206,7 @@ class BlenderCivilPreferences(AddonPreferences):
         name="Debug Mode",
         description="Enable verbose console output and additional logging",
         default=False,
+        update=_debug_mode_update,
     )
     
     show_api_responses: BoolProperty(
@@ -415,8 +431,14 @@ def apply_preferences_to_scene(context=None):
 # =============================================================================
 
 def register():
+    global _debug
     bpy.utils.register_class(BlenderCivilPreferences)
-    print("BlenderCivil preferences registered")
+    
+    # Pick up a debug_mode saved with the user preferences
+    addon = bpy.context.preferences.addons.get(BlenderCivilPreferences.bl_idname)
+    _debug = bool(addon and addon.preferences and addon.preferences.debug_mode)
+    if _debug:
+        print("BlenderCivil preferences registered")
 
 def unregister():
     bpy.utils.unregister_class(BlenderCivilPreferences)
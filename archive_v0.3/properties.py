@@ -10,13 +10,87 @@ Author: BlenderCivil Development Team
 Date: October 24, 2025
 """
 
+import math
+
 import bpy
 from bpy.props import (
     StringProperty, FloatProperty, IntProperty, 
-    BoolProperty, PointerProperty, EnumProperty
+    BoolProperty, PointerProperty, EnumProperty, CollectionProperty
 )
 from bpy.types import PropertyGroup
 
+try:
+    from . import preferences
+except ImportError:
+    import preferences
+
+
+# Curve radius settings shared by every radius property (PI, curve and the
+# operators that create or edit curves), so their limits cannot drift apart
+CURVE_RADIUS_KWARGS = dict(default=500.0, min=10.0, unit='LENGTH')
+
+# Role tags shared by the alignment property groups. As enums they are
+# stored and compared as integers rather than strings.
+_OBJECT_TYPE_ITEMS = (
+    ('ALIGNMENT_PI', 'PI', 'Alignment PI point'),
+    ('ALIGNMENT_TANGENT', 'Tangent', 'Alignment tangent'),
+    ('ALIGNMENT_CURVE', 'Curve', 'Alignment curve'),
+    ('ALIGNMENT_ROOT', 'Root', 'Alignment root container'),
+)
+
+_ELEMENT_TYPE_ITEMS = (
+    ('LINE', 'Line', 'Straight line segment'),
+    ('CURVE', 'Curve', 'Circular arc segment'),
+)
+
+# Choices for the remaining enums, built once at import time
+_TANGENT_CONSTRAINT_ITEMS = (
+    ('FIXED', 'Fixed', 'Both ends locked to PIs - tangent line connects specific points'),
+    ('FLOATING', 'Floating', 'Tangent to one element, maintains relationship'),
+    ('FREE', 'Free', 'Tangent to both adjacent elements, fully dependent'),
+)
+
+_CURVE_CONSTRAINT_ITEMS = (
+    ('FIXED', 'Fixed', 'Fixed radius and location'),
+    ('FLOATING', 'Floating', 'Tangent to one element'),
+    ('FREE', 'Free', 'Tangent to both adjacent tangents - most common'),
+)
+
+_ALIGNMENT_TYPE_ITEMS = (
+    ('CENTERLINE', 'Centerline', 'Main road/rail centerline alignment'),
+    ('ROW', 'Right-of-Way', 'Right-of-way boundary line'),
+    ('EASEMENT', 'Easement', 'Easement boundary line'),
+    ('CURB', 'Curb', 'Curb line alignment'),
+    ('EDGE_PAVEMENT', 'Edge of Pavement', 'Pavement edge line'),
+    ('BASELINE', 'Baseline', 'Design baseline alignment'),
+)
+
+_SHOULDER_TYPE_ITEMS = (
+    ('PAVED', 'Paved', 'Paved shoulder (asphalt/concrete)'),
+    ('GRAVEL', 'Gravel', 'Gravel shoulder'),
+    ('TURF', 'Turf', 'Grass/turf shoulder'),
+)
+
+_MEDIAN_TYPE_ITEMS = (
+    ('FLUSH', 'Flush', 'Flush median (painted or textured)'),
+    ('RAISED', 'Raised', 'Raised median with curbs'),
+    ('DEPRESSED', 'Depressed', 'Depressed median (drainage)'),
+    ('BARRIER', 'Barrier', 'Barrier median (concrete barrier)'),
+)
+
+_TEMPLATE_TYPE_ITEMS = (
+    ('RURAL', 'Rural', 'Rural road section'),
+    ('URBAN', 'Urban', 'Urban street section'),
+    ('HIGHWAY', 'Highway', 'Highway/freeway section'),
+    ('CUSTOM', 'Custom', 'Custom user-defined section'),
+)
+
+_CROWN_TYPE_ITEMS = (
+    ('NORMAL', 'Normal Crown', 'Standard crown (high in center)'),
+    ('REVERSE', 'Reverse Crown', 'Reverse crown (low in center)'),
+    ('SUPERELEVATION', 'Superelevation', 'Banked in curves'),
+)
+
 
 class AlignmentPIProperties(PropertyGroup):
     """
@@ -29,8 +103,9 @@ class AlignmentPIProperties(PropertyGroup):
     """
     
     # Identification
-    object_type: StringProperty(
+    object_type: EnumProperty(
         name="Object Type",
+        items=_OBJECT_TYPE_ITEMS,
         default='ALIGNMENT_PI',
         description="Identifies this as an alignment PI point"
     )
@@ -52,10 +127,8 @@ class AlignmentPIProperties(PropertyGroup):
     
     radius: FloatProperty(
         name="Curve Radius",
-        default=500.0,
-        min=10.0,
-        unit='LENGTH',
-        description="Radius of the curve at this PI"
+        description="Radius of the curve at this PI",
+        **CURVE_RADIUS_KWARGS
     )
     
     design_speed: FloatProperty(
@@ -103,14 +176,16 @@ class AlignmentTangentProperties(PropertyGroup):
     """
     
     # Identification
-    object_type: StringProperty(
+    object_type: EnumProperty(
         name="Object Type",
+        items=_OBJECT_TYPE_ITEMS,
         default='ALIGNMENT_TANGENT',
         description="Identifies this as an alignment tangent"
     )
     
-    element_type: StringProperty(
+    element_type: EnumProperty(
         name="Element Type",
+        items=_ELEMENT_TYPE_ITEMS,
         default='LINE',
         description="Geometric element type"
     )
@@ -118,11 +193,7 @@ class AlignmentTangentProperties(PropertyGroup):
     # Constraint Type
     constraint: EnumProperty(
         name="Constraint",
-        items=[
-            ('FIXED', 'Fixed', 'Both ends locked to PIs - tangent line connects specific points'),
-            ('FLOATING', 'Floating', 'Tangent to one element, maintains relationship'),
-            ('FREE', 'Free', 'Tangent to both adjacent elements, fully dependent'),
-        ],
+        items=_TANGENT_CONSTRAINT_ITEMS,
         default='FIXED',
         description="Constraint type determining how this element behaves during updates"
     )
@@ -187,6 +258,23 @@ class AlignmentTangentProperties(PropertyGroup):
         name="Next Element",
         description="Next element in alignment (curve or tangent)"
     )
+    
+    # Update tracking
+    input_hash: StringProperty(
+        name="Input Hash",
+        default="",
+        description="PI locations the geometry was last computed from"
+    )
+
+
+def _get_curve_length(self):
+    """Arc length derived from radius and delta angle"""
+    return abs(self.radius * self.delta_angle)
+
+
+def _get_curve_tangent_length(self):
+    """PC/PT to PI distance derived from radius and delta angle"""
+    return self.radius * math.tan(abs(self.delta_angle) / 2)
 
 
 class AlignmentCurveProperties(PropertyGroup):
@@ -200,14 +288,16 @@ class AlignmentCurveProperties(PropertyGroup):
     """
     
     # Identification
-    object_type: StringProperty(
+    object_type: EnumProperty(
         name="Object Type",
+        items=_OBJECT_TYPE_ITEMS,
         default='ALIGNMENT_CURVE',
         description="Identifies this as an alignment curve"
     )
     
-    element_type: StringProperty(
+    element_type: EnumProperty(
         name="Element Type",
+        items=_ELEMENT_TYPE_ITEMS,
         default='CURVE',
         description="Geometric element type"
     )
@@ -215,11 +305,7 @@ class AlignmentCurveProperties(PropertyGroup):
     # Constraint Type
     constraint: EnumProperty(
         name="Constraint",
-        items=[
-            ('FIXED', 'Fixed', 'Fixed radius and location'),
-            ('FLOATING', 'Floating', 'Tangent to one element'),
-            ('FREE', 'Free', 'Tangent to both adjacent tangents - most common'),
-        ],
+        items=_CURVE_CONSTRAINT_ITEMS,
         default='FREE',
         description="Constraint type determining how this curve behaves during updates"
     )
@@ -227,10 +313,8 @@ class AlignmentCurveProperties(PropertyGroup):
     # Geometric Properties
     radius: FloatProperty(
         name="Radius",
-        default=500.0,
-        min=10.0,
-        unit='LENGTH',
-        description="Radius of this circular curve"
+        description="Radius of this circular curve",
+        **CURVE_RADIUS_KWARGS
     )
     
     delta_angle: FloatProperty(
@@ -240,17 +324,18 @@ class AlignmentCurveProperties(PropertyGroup):
         description="Central angle (delta) of the curve in radians"
     )
     
+    # Derived from radius and delta angle, so never out of sync with them
     length: FloatProperty(
         name="Length",
-        default=0.0,
         unit='LENGTH',
+        get=_get_curve_length,
         description="Arc length of this curve"
     )
     
     tangent_length: FloatProperty(
         name="Tangent Length",
-        default=0.0,
         unit='LENGTH',
+        get=_get_curve_tangent_length,
         description="Length from PC/PT to PI along tangent"
     )
     
@@ -293,6 +378,28 @@ class AlignmentCurveProperties(PropertyGroup):
         name="Next Element",
         description="Next element in alignment (tangent)"
     )
+    
+    # Update tracking
+    input_hash: StringProperty(
+        name="Input Hash",
+        default="",
+        description="PI locations and radius the geometry was last computed from"
+    )
+
+
+class AlignmentElementRef(PropertyGroup):
+    """
+    Reference to one tangent or curve object of an alignment.
+    
+    Collected on the alignment root so its elements can be iterated
+    directly instead of filtering the horizontal layout collection.
+    """
+    
+    obj: PointerProperty(
+        name="Object",
+        type=bpy.types.Object,
+        description="Referenced alignment element"
+    )
 
 
 class AlignmentRootProperties(PropertyGroup):
@@ -306,8 +413,9 @@ class AlignmentRootProperties(PropertyGroup):
     """
     
     # Identification
-    object_type: StringProperty(
+    object_type: EnumProperty(
         name="Object Type",
+        items=_OBJECT_TYPE_ITEMS,
         default='ALIGNMENT_ROOT',
         description="Identifies this as an alignment root container"
     )
@@ -321,14 +429,7 @@ class AlignmentRootProperties(PropertyGroup):
     # Alignment Type
     alignment_type: EnumProperty(
         name="Alignment Type",
-        items=[
-            ('CENTERLINE', 'Centerline', 'Main road/rail centerline alignment'),
-            ('ROW', 'Right-of-Way', 'Right-of-way boundary line'),
-            ('EASEMENT', 'Easement', 'Easement boundary line'),
-            ('CURB', 'Curb', 'Curb line alignment'),
-            ('EDGE_PAVEMENT', 'Edge of Pavement', 'Pavement edge line'),
-            ('BASELINE', 'Baseline', 'Design baseline alignment'),
-        ],
+        items=_ALIGNMENT_TYPE_ITEMS,
         default='CENTERLINE',
         description="Functional type of this alignment"
     )
@@ -362,6 +463,25 @@ class AlignmentRootProperties(PropertyGroup):
         default=True,
         description="Automatically update alignment when PIs are moved"
     )
+    
+    # Element references (filled in as tangents and curves are created)
+    tangent_refs: CollectionProperty(
+        type=AlignmentElementRef,
+        name="Tangents",
+        description="Tangent objects belonging to this alignment"
+    )
+    
+    curve_refs: CollectionProperty(
+        type=AlignmentElementRef,
+        name="Curves",
+        description="Curve objects belonging to this alignment"
+    )
+    
+    element_refs_complete: BoolProperty(
+        name="Element References Complete",
+        default=False,
+        description="Tangent and curve references cover every element of this alignment"
+    )
 
 
 
@@ -433,11 +553,7 @@ class ShoulderProperties(PropertyGroup):
     
     type: EnumProperty(
         name="Shoulder Type",
-        items=[
-            ('PAVED', 'Paved', 'Paved shoulder (asphalt/concrete)'),
-            ('GRAVEL', 'Gravel', 'Gravel shoulder'),
-            ('TURF', 'Turf', 'Grass/turf shoulder'),
-        ],
+        items=_SHOULDER_TYPE_ITEMS,
         default='PAVED',
         description="Surface type of shoulder"
     )
@@ -462,12 +578,7 @@ class MedianProperties(PropertyGroup):
     
     type: EnumProperty(
         name="Median Type",
-        items=[
-            ('FLUSH', 'Flush', 'Flush median (painted or textured)'),
-            ('RAISED', 'Raised', 'Raised median with curbs'),
-            ('DEPRESSED', 'Depressed', 'Depressed median (drainage)'),
-            ('BARRIER', 'Barrier', 'Barrier median (concrete barrier)'),
-        ],
+        items=_MEDIAN_TYPE_ITEMS,
         default='FLUSH',
         description="Type of median treatment"
     )
@@ -510,12 +621,7 @@ class CrossSectionTemplate(PropertyGroup):
     
     template_type: EnumProperty(
         name="Template Type",
-        items=[
-            ('RURAL', 'Rural', 'Rural road section'),
-            ('URBAN', 'Urban', 'Urban street section'),
-            ('HIGHWAY', 'Highway', 'Highway/freeway section'),
-            ('CUSTOM', 'Custom', 'Custom user-defined section'),
-        ],
+        items=_TEMPLATE_TYPE_ITEMS,
         default='RURAL',
         description="Classification of this template"
     )
@@ -529,11 +635,7 @@ class CrossSectionTemplate(PropertyGroup):
     
     crown_type: EnumProperty(
         name="Crown Type",
-        items=[
-            ('NORMAL', 'Normal Crown', 'Standard crown (high in center)'),
-            ('REVERSE', 'Reverse Crown', 'Reverse crown (low in center)'),
-            ('SUPERELEVATION', 'Superelevation', 'Banked in curves'),
-        ],
+        items=_CROWN_TYPE_ITEMS,
         default='NORMAL',
         description="Type of cross slope configuration"
     )
@@ -652,6 +754,7 @@ classes = (
     AlignmentPIProperties,
     AlignmentTangentProperties,
     AlignmentCurveProperties,
+    AlignmentElementRef,
     AlignmentRootProperties,
     # Cross-Section Properties (Sprint 1)
     LaneProperties,
@@ -661,16 +764,12 @@ classes = (
     SectionAssignment,
 )
 
-
-
-
-
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
 def register():
     """Register property groups"""
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     
     # Register properties on Object type
     bpy.types.Object.alignment_pi = PointerProperty(type=AlignmentPIProperties)
@@ -692,7 +791,8 @@ def register():
         description="Library of cross-section templates"
     )
     
-    print("âœ“ BlenderCivil v0.3.0: Property system registered")
+    if preferences.is_debug():
+        print("âœ“ BlenderCivil v0.3.0: Property system registered")
 
 
 def unregister():
@@ -714,8 +814,7 @@ def unregister():
     del bpy.types.Object.alignment_root
     
     # Unregister classes in reverse order
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
 
 
 if __name__ == "__main__":
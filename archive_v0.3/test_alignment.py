@@ -74,7 +74,7 @@ def test_alignment_creation():
     pis = create_test_pis()
     
     # Create alignment using operator
-    bpy.ops.civil.create_alignment_separate_v2(
+    bpy.ops.civil.create_alignment_separate(
         alignment_name="Test_Alignment",
         default_radius=500.0,
         design_speed=35.0
@@ -106,7 +106,7 @@ def test_manual_update():
     print(f"  to {new_loc}")
     
     # Manual update
-    bpy.ops.civil.update_alignment_v2()
+    bpy.ops.civil.update_alignment()
     
     print("\nâœ“ Manual update test PASSED")
 
@@ -117,11 +117,91 @@ def test_analysis():
     print("TEST: ALIGNMENT ANALYSIS")
     print("="*60)
     
-    bpy.ops.civil.analyze_alignment_v2()
+    bpy.ops.civil.analyze_alignment()
     
     print("\nâœ“ Analysis test PASSED")
 
 
+def test_insert_pi():
+    """Test inserting a PI between two consecutive PIs"""
+    print("\n" + "="*60)
+    print("TEST: INSERT PI")
+    print("="*60)
+    
+    pi_before = bpy.data.objects.get("PI_002")
+    pi_after = bpy.data.objects.get("PI_003")
+    if not pi_before or not pi_after:
+        print("  âš  Cannot find PI_002 and PI_003")
+        return
+    
+    # Select the two PIs
+    bpy.ops.object.select_all(action='DESELECT')
+    pi_before.select_set(True)
+    pi_after.select_set(True)
+    
+    mid = (pi_before.location + pi_after.location) / 2
+    bpy.ops.civil.insert_pi(location_x=mid.x, location_y=mid.y + 20, location_z=mid.z,
+                            curve_radius=300.0)
+    
+    # PIs, tangents and curves are renumbered without duplicate (.001) names
+    for i in range(1, 7):
+        pi = bpy.data.objects.get(f"PI_{i:03d}")
+        assert pi and pi.alignment_pi.index == i, f"PI_{i:03d} missing or misnumbered"
+        if i < 6:
+            tangent = pi.alignment_pi.tangent_out
+            assert tangent and tangent.name == f"Tangent_{i:03d}", f"Tangent after PI_{i:03d} misnamed"
+        if 1 < i < 6 and pi.alignment_pi.curve:
+            assert pi.alignment_pi.curve.name == f"Curve_{i - 1:03d}", f"Curve at PI_{i:03d} misnamed"
+    
+    duplicates = [obj.name for obj in bpy.data.objects
+                  if obj.name.startswith(("PI_", "Tangent_", "Curve_")) and '.' in obj.name]
+    assert not duplicates, f"Duplicate names after insert: {duplicates}"
+    
+    print("\nâœ“ Insert PI test PASSED")
+
+
+def test_insert_pi_parented_root():
+    """Test Insert PI when the alignment root is parented under another empty"""
+    print("\n" + "="*60)
+    print("TEST: INSERT PI WITH PARENTED ROOT")
+    print("="*60)
+    
+    pi_before = bpy.data.objects.get("PI_003")
+    pi_after = bpy.data.objects.get("PI_004")
+    if not pi_before or not pi_after:
+        print("  âš  Cannot find PI_003 and PI_004")
+        return
+    
+    # Put the alignment root under an organizing empty
+    alignment_root = pi_before.parent
+    organizer = bpy.data.objects.new("Project_Organizer", None)
+    bpy.context.scene.collection.objects.link(organizer)
+    alignment_root.parent = organizer
+    
+    h_layout = bpy.data.collections[f"{alignment_root.alignment_root.alignment_name}_Horizontal"]
+    pi_count = sum(1 for obj in h_layout.objects if obj.name.startswith("PI_"))
+    
+    bpy.ops.object.select_all(action='DESELECT')
+    pi_before.select_set(True)
+    pi_after.select_set(True)
+    
+    mid = (pi_before.location + pi_after.location) / 2
+    result = bpy.ops.civil.insert_pi(location_x=mid.x, location_y=mid.y - 20, location_z=mid.z,
+                                     curve_radius=300.0)
+    
+    # The operator must resolve the alignment root, not the organizer
+    assert result == {'FINISHED'}, f"Insert PI returned {result}"
+    new_count = sum(1 for obj in h_layout.objects if obj.name.startswith("PI_"))
+    assert new_count == pi_count + 1, f"Expected {pi_count + 1} PIs, found {new_count}"
+    new_pi = bpy.data.objects.get("PI_004")
+    assert new_pi and new_pi.parent == alignment_root, "New PI not parented to the alignment root"
+    
+    alignment_root.parent = None
+    bpy.data.objects.remove(organizer)
+    
+    print("\nâœ“ Insert PI with parented root test PASSED")
+
+
 def test_auto_update():
     """Test auto-update functionality"""
     print("\n" + "="*60)
@@ -168,6 +248,8 @@ def run_all_tests():
         test_alignment_creation()
         test_manual_update()
         test_analysis()
+        test_insert_pi()
+        test_insert_pi_parented_root()
         test_auto_update()
         
         print("\n" + "#"*60)
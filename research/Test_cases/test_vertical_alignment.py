@@ -522,7 +522,50 @@ class TestVerticalAlignment:
         stations = [p[0] for p in points]
         assert 0.0 in stations
         assert 100.0 in stations
-    
+
+    def test_alignment_profile_points_vec(self):
+        """Test vectorized profile evaluation matches the segment objects"""
+        valign = VerticalAlignment()
+
+        valign.add_pvi(0.0, 100.0)
+        valign.add_pvi(200.0, 105.0, curve_length=80.0)
+        valign.add_pvi(450.0, 103.0, curve_length=100.0)
+        valign.add_pvi(650.0, 110.0)
+
+        # Includes the shared BVC/EVC stations 160, 240, 400 and 500
+        query = [0.0, 100.0, 160.0, 200.0, 240.0, 300.0, 400.0, 425.0,
+                 450.0, 500.0, 575.0, 650.0]
+        stations, elevs, grades = valign.get_profile_points_vec(query)
+
+        assert list(stations) == query
+        for sta, elev, grade in zip(query, elevs, grades):
+            segment = next(s for s in valign.segments if s.contains_station(sta))
+            assert elev == pytest.approx(segment.get_elevation(sta), abs=1e-9)
+            assert grade == pytest.approx(segment.get_grade(sta), abs=1e-12)
+
+        with pytest.raises(ValueError):
+            valign.get_profile_points_vec([700.0])
+
+    def test_alignment_query(self):
+        """Test combined elevation and grade query"""
+        valign = VerticalAlignment()
+
+        valign.add_pvi(0.0, 100.0)
+        valign.add_pvi(200.0, 105.0, curve_length=80.0)
+        valign.add_pvi(400.0, 103.0)
+
+        # At the PVI of the crest curve: E = 104 + 0.025×40 - 0.035/160×40²
+        elev, grade = valign.query(200.0)
+        assert elev == pytest.approx(104.65, abs=1e-6)
+        assert grade == pytest.approx(0.0075, abs=1e-9)
+
+        elevs, grades = valign.query_batch([200.0, 300.0])
+        assert elevs[0] == pytest.approx(elev, abs=1e-9)
+        assert grades[1] == pytest.approx(-0.01, abs=1e-9)
+
+        with pytest.raises(ValueError):
+            valign.query(-10.0)
+
     def test_alignment_validation_success(self):
         """Test validation of valid alignment"""
         valign = VerticalAlignment(design_speed=80.0)